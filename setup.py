@@ -3,13 +3,26 @@
 #  Licensed under the MIT License. See License.txt in the project root for license information.
 # =================================================================================================
 from setuptools import setup, find_packages
+
+# Compile the command-message module to C when Cython is available. The
+# classes in vex_messages.py only assign attributes and build dicts, which
+# Cython speeds up considerably; the pure-Python module is the fallback and
+# stays authoritative, so no build-time dependency is introduced.
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(['vex/vex_messages.py'], language_level=3)
+except ImportError:
+    ext_modules = []
+
 setup(
     name='vex',
     version='1.0.1',
     packages=find_packages(where='./vex'),
     package_dir={'': '.'},
+    ext_modules=ext_modules,
     install_requires=[
-        'websocket-client'
+        'websocket-client',
+        'numpy'
     ],
     include_package_data=True,
     description='VEX AIM WebSocket Python Client',
@@ -0,0 +1,19 @@
+# =================================================================================================
+#  Copyright (c) Innovation First 2025. All rights reserved.
+#  Licensed under the MIT License. See License.txt in the project root for license information.
+# =================================================================================================
+"""
+AIM WebSocket API - JSON helpers
+
+Compact serialization for outgoing WebSocket payloads. Uses orjson (which
+returns bytes directly from a SIMD-accelerated encoder) when installed and
+falls back to the stdlib encoder.
+"""
+import json
+
+try:
+    from orjson import dumps
+except ImportError:
+    def dumps(obj) -> bytes:
+        """serialize obj to compact UTF-8 JSON bytes"""
+        return json.dumps(obj, separators=(',', ':')).encode()
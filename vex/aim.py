@@ -16,19 +16,29 @@ classes and methods for controlling robot movement, sensors, and other features.
 # pylint: disable=invalid-name,unused-import,redefined-outer-name
 import io
 import json
+import struct
+import heapq
+import itertools
+import os
+from concurrent.futures import ThreadPoolExecutor
 import time
 import threading
 import sys
 from typing import Union, cast, Callable
+from operator import itemgetter
 import math
+import traceback
 import atexit
+import contextlib
 import signal
 import _thread
 import pathlib
+import numpy as np
 import websocket
 from .settings import Settings
 from . import vex_types as vex #importing from the same package
 from . import vex_messages as commands
+from ._json import dumps as _json_dumps
 #module-specific "constant" globals
 VERSION_MAJOR = 1
 VERSION_MINOR = 0
@@ -54,6 +64,8 @@ BALL_MIN_Y          = 170
 BALL_MIN_CX         = 120
 BALL_MAX_CX         = 200
 
+_BARREL_CLASSES = ("BlueBarrel", "OrangeBarrel")
+
 AIVISION_MAX_OBJECTS               = 24
 AIVISION_DEFAULT_SNAPSHOT_OBJECTS  =  8
 
@@ -142,8 +154,10 @@ class WSStatusThread(WSThread):
             "controller": {"flags": "0x0000", "stick_x": 0, "stick_y": 0, "battery": 0},
             "robot": {
                 "flags": "0x00000000",
+                "flags_int": 0,
                 "battery": 0,
                 "touch_flags": "0x0000",
+                "touch_flags_int": 0,
                 "touch_x": 0,
                 "touch_y": 0,
                 "robot_x": 0,
@@ -233,81 +247,69 @@ class WSStatusThread(WSThread):
             self.sound_downloading_flag_needs_setting = False
 
 
+    def _set_robot_flag_bits(self, mask):
+        """ set bits in the robot flags, keeping the int and hex-string forms in sync"""
+        robot_status = self.current_status["robot"]
+        new_robot_flags = robot_status["flags_int"] | mask
+        robot_status["flags_int"] = new_robot_flags
+        robot_status["flags"] = hex(new_robot_flags)
+
+    def _clear_robot_flag_bits(self, mask):
+        """ clear bits in the robot flags, keeping the int and hex-string forms in sync"""
+        robot_status = self.current_status["robot"]
+        new_robot_flags = robot_status["flags_int"] & ~mask
+        robot_status["flags_int"] = new_robot_flags
+        robot_status["flags"] = hex(new_robot_flags)
+
     def set_is_move_active_flag(self):
         """ set the is_move_active flag in the robot status"""
-        robot_flags = self.current_status["robot"]["flags"]
-        #update is_move_active flag (convert robot_flags to int, set bit 1 to 1, then convert back to hex string)
-        new_robot_flags = hex(int(robot_flags, 16) | SYS_FLAGS_IS_MOVE_ACTIVE)
-        self.current_status["robot"]["flags"] = new_robot_flags
+        self._set_robot_flag_bits(SYS_FLAGS_IS_MOVE_ACTIVE)
 
     def set_is_turn_active_flag(self):
         """ set the is_turn_active flag in the robot status"""
-        robot_flags = self.current_status["robot"]["flags"]
-        #update is_turn_active flag (convert robot_flags to int, set bit 1 to 1, then convert back to hex string)
-        new_robot_flags = hex(int(robot_flags, 16) | SYS_FLAGS_IS_TURN_ACTIVE)
-        self.current_status["robot"]["flags"] = new_robot_flags
+        self._set_robot_flag_bits(SYS_FLAGS_IS_TURN_ACTIVE)
 
     def set_is_moving_flag(self):
         """ set the is_moving flag in the robot status"""
-        robot_flags = self.current_status["robot"]["flags"]
-        #update is_moving flag
-        #convert robot_flags to int, set bit 1 to 1, then convert back to hex string
-        new_robot_flags = hex(int(robot_flags, 16) | SYS_FLAGS_IS_MOVING)
-        self.current_status["robot"]["flags"] = new_robot_flags
+        self._set_robot_flag_bits(SYS_FLAGS_IS_MOVING)
 
     def clear_is_moving_flag(self):
         """ reset the is_moving flag in the robot status"""
-        robot_flags = self.current_status["robot"]["flags"]
-        #update is_moving flag
-        #convert robot_flags to int, set bit 1 to 1, then convert back to hex string
-        new_robot_flags = hex(int(robot_flags, 16) & ~SYS_FLAGS_IS_MOVING)
-        self.current_status["robot"]["flags"] = new_robot_flags
+        self._clear_robot_flag_bits(SYS_FLAGS_IS_MOVING)
 
     def set_imu_cal_flag(self):
         """ set the flag to say is IMU calibrating based on the robot status"""
-        robot_flags = self.current_status["robot"]["flags"]
-        #update imu_cal flag
-        #convert robot_flags to int, set bit 1 to 1, then convert back to hex string
-        new_robot_flags = hex(int(robot_flags, 16) | SYS_FLAGS_IMU_CAL)
-        self.current_status["robot"]["flags"] = new_robot_flags
+        self._set_robot_flag_bits(SYS_FLAGS_IMU_CAL)
 
     def set_sound_playing_flag(self):
         """ set the flag to say sound is playing based on the status"""
-        robot_flags = self.current_status["robot"]["flags"]
-        #update sound_playing flag
-        #convert robot_flags to int, set bit 1 to 1, then convert back to hex string
-        new_robot_flags = hex(int(robot_flags, 16) | SYS_FLAGS_SOUND_PLAYING)
-        self.current_status["robot"]["flags"] = new_robot_flags
+        self._set_robot_flag_bits(SYS_FLAGS_SOUND_PLAYING)
 
     def set_sound_downloading_flag(self):
         """ set the flag to say sound is downloading based on the status"""
-        robot_flags = self.current_status["robot"]["flags"]
-        #update is_sound_downloading flag
-        # convert robot_flags to int, set bit 1 to 1, then convert back to hex string
-        new_robot_flags = hex(int(robot_flags, 16) | SYS_FLAGS_IS_SOUND_DNL)
-        self.current_status["robot"]["flags"] = new_robot_flags
+        self._set_robot_flag_bits(SYS_FLAGS_IS_SOUND_DNL)
 
     def check_shake_flag(self):
         """ detect if the robot has been shaken"""
         # previously, a shake would cause program to exit.
         # This was problematic, so nothing is done currently.
-        robot_flags = self.current_status["robot"]["flags"]
-        # if int(robot_flags, 16) & SYS_FLAGS_IS_SHAKE != 0:
+        robot_flags = self.current_status["robot"]["flags_int"]
+        # if robot_flags & SYS_FLAGS_IS_SHAKE != 0:
             # _thread.interrupt_main()
 
     def check_power_button_flag(self):
         """ detect if the power button has been pressed to exit the program"""
-        robot_flags = self.current_status["robot"]["flags"]
-        if int(robot_flags, 16) & SYS_FLAGS_PWR_BUTTON != 0:
+        robot_flags = self.current_status["robot"]["flags_int"]
+        if robot_flags & SYS_FLAGS_PWR_BUTTON != 0:
             print("detected power button press, exiting program")
             _thread.interrupt_main()
 
     def check_program_active_flag(self):
         """Going from program_active == True to program_active == False exits the program"""
-        robot_flags = self.current_status["robot"]["flags"]
+        robot_flags = self.current_status["robot"]["flags_int"]
         program_active_old = self.program_active
 
-        if int(robot_flags, 16) & SYS_FLAGS_PROG_ACTIVE != 0:
+        if robot_flags & SYS_FLAGS_PROG_ACTIVE != 0:
             self.program_active = True
         else:
             self.program_active = False
@@ -318,14 +320,14 @@ class WSStatusThread(WSThread):
 
     def check_crash_flag(self):
         """ detect if the robot has crashed and fire the appropriate callbacks"""
-        robot_flags = self.current_status["robot"]["flags"]
-        if int(robot_flags, 16) & SYS_FLAGS_HAS_CRASHED != 0:
+        robot_flags = self.current_status["robot"]["flags_int"]
+        if robot_flags & SYS_FLAGS_HAS_CRASHED != 0:
             for (cb, args) in self._inertial_crashed_callbacks:
                 cb(*args)
 
     def check_screen_pressing(self):
         """Check if the screen is being pressed, call pressed/released callbacks on transition."""
-        is_pressed = bool(int(self.current_status["robot"]["touch_flags"], 16) & 0x0001)
+        is_pressed = bool(self.current_status["robot"]["touch_flags_int"] & 0x0001)
 
         # If newly pressed
         if is_pressed and not self._last_screen_pressed:
@@ -379,6 +381,10 @@ class WSStatusThread(WSThread):
                 if not status_packet_error:
                     try:
                         new_status = json.loads(new_status_json)
+                        # parse the hex-string flags once per packet so readers can use plain ints
+                        robot_status = new_status["robot"]
+                        robot_status["flags_int"] = int(robot_status["flags"], 16)
+                        robot_status["touch_flags_int"] = int(robot_status["touch_flags"], 16)
                     except Exception:
                         status_packet_error = True
 
@@ -511,6 +517,19 @@ class WSAudioThread(WSThread):
 
             time.sleep(0.2)
 
+def _spin_wheels_json(v1, v2, v3):
+    """build the spin_wheels JSON command string directly; int-cast and
+    serialization fused into one f-string for the teleop hot path"""
+    return f'{{"cmd_id":"spin_wheels","vel1":{int(v1)},"vel2":{int(v2)},"vel3":{int(v3)}}}'
+
+# parameterless commands always serialize to the same bytes, so freeze the
+# payload strings once at import time instead of re-serializing per call
+_MSG_HIDE_EMOJI    = json.dumps(commands.ScreenHideEmoji().to_json(), separators=(',',':'))
+_MSG_SHOW_AIVISION = json.dumps(commands.ScreenShowAivision().to_json(), separators=(',',':'))
+_MSG_HIDE_AIVISION = json.dumps(commands.ScreenHideAivision().to_json(), separators=(',',':'))
+_MSG_SOUND_STOP    = json.dumps(commands.SoundStop().to_json(), separators=(',',':'))
+_MSG_KICK_SOFT     = json.dumps(commands.KickerKick(vex.KickType.SOFT).to_json(), separators=(',',':'))
+
 class ColorRGB:
     """ RGB color class"""
     def __init__(self, r: int, g: int, b: int, t: bool=False):
@@ -542,6 +561,16 @@ class Robot():
             f"Running version {VERSION_MAJOR}.{VERSION_MINOR}.{VERSION_BUILD}.{VERSION_BETA} "
             f"and connecting to {self.host}"
         )
+        # when not None, serialized commands are queued here instead of sent (see batch())
+        self._batch_buffer = None
+        # last payload sent per cmd_id, used to skip redundant re-sends (see robot_send)
+        self._last_sent = {}
+        # write-delay coalescing state (see set_write_delay)
+        self._write_delay = 0.0
+        self._pending_sends = []
+        self._send_cond = threading.Condition()
+        self._send_lock = threading.RLock()
+        self._write_delay_thread = None
         self.move_active_cmd_list = ["drive", "drive_for"]
         self.turn_active_cmd_list = [ "turn", "turn_for", "turn_to"]
         self.stopped_active_cmd_list = self.move_active_cmd_list + self.turn_active_cmd_list
@@ -633,9 +662,6 @@ class Robot():
         and terminate program unless the user handles the exception.
         """
         method = object.__getattribute__(self, name)
-        if not method:
-            # raise Exception("Method %s not implemented" %name)
-            return
         if callable(method):
             if self._ws_cmd_thread.ws.connected is False:
                 raise DisconnectedException(f"error calling {name}: not connected to robot")
@@ -673,59 +699,148 @@ class Robot():
     #endregion private internal methods
 
     #region Generic methods to send commands to the robot
-    def robot_send(self, json_cmd):
-        """send a command to the robot through websocket connection"""
-        disconnected_error = False
+    def robot_send(self, json_cmd, dedupe=False):
+        """send a command to the robot through websocket connection.
+        With dedupe=True, the command is skipped if it is identical to the
+        last payload sent for the same cmd_id (for idempotent settings commands)"""
         #print(json_cmd)
-        json_cmd_string = json.dumps(json_cmd, separators=(',',':'))
-        #print("sending: ", json_cmd_string)
         try:
             cmd_id = json_cmd["cmd_id"]
         except:
             print("robot_send did not receive a cmd_id")
             return
 
-        self._ws_cmd_thread.ws_send(str.encode(json_cmd_string), websocket.ABNF.OPCODE_BINARY)
-        try:
-            response_json = self._ws_cmd_thread.ws_receive()
-        except ReceiveErrorException:
-            disconnected_error = True
-            raise DisconnectedException(f"robot got disconnected after sending cmd_id: {cmd_id}") from None # disable exception chaining
-            # not trying to resend command because that would take too long, let user decide.
+        self.robot_send_raw(_json_dumps(json_cmd), cmd_id, dedupe)
 
-        try:
-            response = json.loads(response_json)
-        except Exception as error:
-            print(f"{cmd_id} Error: could not parse ws_cmd JSON response: '{error}'")
-            print("response_json", response_json)
+    def robot_send_raw(self, json_cmd_string, cmd_id, dedupe=False):
+        """send an already-serialized JSON command (str or bytes) to the robot.
+        Fast path for hot loops that build their JSON directly, skipping json.dumps"""
+        if isinstance(json_cmd_string, str):
+            # the send pipeline works in bytes; encode str payloads once here
+            json_cmd_string = json_cmd_string.encode()
+        if dedupe and self._last_sent.get(cmd_id) == json_cmd_string:
             return
-
-        # print("response_json", response_json)
-        if response["cmd_id"] == "cmd_unknown":
-            print("robot: did not recognize command: ", cmd_id)
+        self._last_sent[cmd_id] = json_cmd_string
+        if self._batch_buffer is not None:
+            self._batch_buffer.append(json_cmd_string)
             return
+        if self._write_delay > 0:
+            with self._send_cond:
+                self._pending_sends.append((json_cmd_string, cmd_id))
+                self._send_cond.notify()
+            return
+        self._transmit(json_cmd_string, cmd_id)
+
+    def _transmit(self, json_cmd_string, cmd_id):
+        """write one frame on the command socket and process the response.
+        The lock keeps the send/receive pair atomic when the write-delay
+        flusher thread shares the command socket with user code"""
+        with self._send_lock:
+            disconnected_error = False
+            #print("sending: ", json_cmd_string)
+            if isinstance(json_cmd_string, str):
+                json_cmd_string = json_cmd_string.encode()
+            self._ws_cmd_thread.ws_send(json_cmd_string, websocket.ABNF.OPCODE_BINARY)
+            try:
+                response_json = self._ws_cmd_thread.ws_receive()
+            except ReceiveErrorException:
+                disconnected_error = True
+                raise DisconnectedException(f"robot got disconnected after sending cmd_id: {cmd_id}") from None # disable exception chaining
+                # not trying to resend command because that would take too long, let user decide.
 
-        if response["status"] == "error":
             try:
-                error_info_string = response["error_info"]
-            except KeyError:
-                error_info_string = "no reason given"
-            print("robot: error processing command, reason: ", error_info_string)
-            return
+                response = json.loads(response_json)
+            except Exception as error:
+                print(f"{cmd_id} Error: could not parse ws_cmd JSON response: '{error}'")
+                print("response_json", response_json)
+                return
+
+            # print("response_json", response_json)
+            if response["cmd_id"] == "cmd_unknown":
+                print("robot: did not recognize command: ", cmd_id)
+                return
+
+            if response["status"] == "error":
+                try:
+                    error_info_string = response["error_info"]
+                except KeyError:
+                    error_info_string = "no reason given"
+                print("robot: error processing command, reason: ", error_info_string)
+                return
+
+            # trigger a local update to the robot status flags in ws_status_thread
+            if response["status"] in ["complete", "in_progress"]:
+                if response["cmd_id"] in self.move_active_cmd_list:
+                    self._ws_status_thread.is_move_active_flag_needs_setting = True
+                if response["cmd_id"] in self.turn_active_cmd_list:
+                    self._ws_status_thread.is_turn_active_flag_needs_setting = True
+                if response["cmd_id"] in self.stopped_active_cmd_list:
+                    self._ws_status_thread.is_moving_flag_needs_setting  = True
+                    self._ws_status_thread.is_moving_flag_needs_clearing = False
+                if response["cmd_id"] == "imu_calibrate":
+                    self._ws_status_thread.imu_cal_flag_needs_setting = True
 
-        # trigger a local update to the robot status flags in ws_status_thread
-        if response["status"] in ["complete", "in_progress"]:
-            if response["cmd_id"] in self.move_active_cmd_list:
-                self._ws_status_thread.is_move_active_flag_needs_setting = True
-            if response["cmd_id"] in self.turn_active_cmd_list:
-                self._ws_status_thread.is_turn_active_flag_needs_setting = True
-            if response["cmd_id"] in self.stopped_active_cmd_list:
-                self._ws_status_thread.is_moving_flag_needs_setting  = True
-                self._ws_status_thread.is_moving_flag_needs_clearing = False
-            if response["cmd_id"] == "imu_calibrate":
-                self._ws_status_thread.imu_cal_flag_needs_setting = True
+            return
 
-        return
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        context manager that coalesces all commands sent inside the block into
+        a single batched WebSocket send, instead of one write per command\n
+        ### Example:
+        with robot.batch():\n
+            robot.led.on(vex.LightType.ALL_LEDS, vex.Color.BLUE)\n
+            robot.screen.clear_screen()
+        """
+        if self._batch_buffer is not None:
+            # already inside a batch; let the outermost block flush
+            yield
+            return
+        self._batch_buffer = []
+        try:
+            yield
+        finally:
+            queued = self._batch_buffer
+            self._batch_buffer = None
+            if queued:
+                self._transmit(b'{"cmd_id":"batch","items":[' + b','.join(queued) + b']}', "batch")
+
+    def set_write_delay(self, delay, units=vex.TimeUnits.MSEC):
+        """
+        coalesce rapid-fire commands sent within the given window into a single
+        batched WebSocket frame, trading a few ms of latency for far fewer
+        socket writes (useful before LED animation or screen-draw loops).\n
+        A delay of 0 (the default) restores immediate per-command sends.\n
+        ### Example:
+        robot.set_write_delay(10) # 10 ms window
+        """
+        if units == vex.TimeUnits.MSEC:
+            delay = delay / 1000
+        self._write_delay = delay
+        if delay > 0 and self._write_delay_thread is None:
+            flusher = threading.Thread(target=self._write_delay_flusher, daemon=True)
+            self._write_delay_thread = flusher
+            flusher.start()
+
+    def _write_delay_flusher(self):
+        """drain commands queued by robot_send_raw during the write-delay window
+        and transmit them as one frame (runs on its own daemon thread)"""
+        cond = self._send_cond
+        while True:
+            with cond:
+                while not self._pending_sends:
+                    cond.wait()
+            time.sleep(self._write_delay)  # let the window fill
+            with cond:
+                queued = self._pending_sends
+                self._pending_sends = []
+            try:
+                if len(queued) == 1:
+                    self._transmit(queued[0][0], queued[0][1])
+                else:
+                    self._transmit(b'{"cmd_id":"batch","items":[' + b','.join(cmd for cmd, _ in queued) + b']}', "batch")
+            except DisconnectedException as error:
+                print("write-delay flusher:", error)
 
     def robot_send_audio(self, audio):
         """ send audio to the robot through websocket audio thread"""
@@ -768,16 +883,16 @@ class Robot():
         """returns true if a move_at() or move_for() command is active with nonzero speed"""
         if self._ws_status_thread.is_move_active_flag_needs_setting:
             return True
-        robot_flags = self.status["robot"]["flags"]
-        is_move_active = bool(int(robot_flags, 16) & SYS_FLAGS_IS_MOVE_ACTIVE)
+        robot_flags = self.status["robot"]["flags_int"]
+        is_move_active = bool(robot_flags & SYS_FLAGS_IS_MOVE_ACTIVE)
         return is_move_active
 
     def is_turn_active(self):
         """returns true if a turn(), turn_to(), or turn_for() command is active with nonzero speed"""
         if self._ws_status_thread.is_turn_active_flag_needs_setting:
             return True
-        robot_flags = self.status["robot"]["flags"]
-        is_turn_active = bool(int(robot_flags, 16) & SYS_FLAGS_IS_TURN_ACTIVE)
+        robot_flags = self.status["robot"]["flags_int"]
+        is_turn_active = bool(robot_flags & SYS_FLAGS_IS_TURN_ACTIVE)
         return is_turn_active
 
     def is_stopped(self):
@@ -786,8 +901,8 @@ class Robot():
             return True
         if self._ws_status_thread.is_moving_flag_needs_setting:
             return False
-        robot_flags = self.status["robot"]["flags"]
-        is_stopped = not bool(int(robot_flags, 16) & SYS_FLAGS_IS_MOVING)
+        robot_flags = self.status["robot"]["flags_int"]
+        is_stopped = not bool(robot_flags & SYS_FLAGS_IS_MOVING)
         return is_stopped
     #endregion Sensing Motion
 
@@ -940,7 +1055,7 @@ class Robot():
         w1 = (0.5 * x) + ((0.866) * y) + r
         w2 = (0.5 * x) - ((0.866) * y) + r
         w3 = r - x
-        self.spin_wheels(int(w1), int(w2), int(w3))
+        self.spin_wheels_raw(w1, w2, w3)
 
     def turn(self, direction: vex.TurnType, velocity=None, units:vex.TurnVelocityPercentUnits=vex.TurnVelocityUnits.PERCENT):
         """turn indefinitely at velocity (DPS) in the direction specified by turn_direction (TurnType.LEFT or TurnType.RIGHT). 
@@ -1037,6 +1152,11 @@ class Robot():
         message = commands.SpinWheels(velocity1, velocity2, velocity3)
         self.robot_send(message.to_json())
 
+    def spin_wheels_raw(self, velocity1: float, velocity2: float, velocity3: float):
+        """spin all three wheels at the specified velocities (floats accepted).
+        Serializes directly without building a SpinWheels command object"""
+        self.robot_send_raw(_spin_wheels_json(velocity1, velocity2, velocity3), "spin_wheels")
+
     def set_xy_position(self, x, y):
         """sets the robot’s current position to the specified values"""
         offset_radians = -math.radians(self.inertial.heading_offset)
@@ -1058,52 +1178,43 @@ class Robot():
     #region Vision Commands
     def has_any_barrel(self):
         """returns true if a barrel is held by the kicker"""
-        ai_objects = list(self.vision.get_data(AiVision.ALL_AIOBJS))
-        has_barrel = False
-        for object in range(len(ai_objects)):
-            cx = ai_objects[object].originX + ai_objects[object].width/2
-            if ai_objects[object].classname in ["BlueBarrel", "OrangeBarrel"] and \
+        for obj in self.vision.get_data(AiVision.ALL_AIOBJS):
+            cx = obj.originX + obj.width * 0.5
+            if obj.classname in _BARREL_CLASSES and \
                BARREL_MIN_CX < cx < BARREL_MAX_CX and \
-               ai_objects[object].originY > BARREL_MIN_Y:
-                has_barrel = True
-
-        return has_barrel
+               obj.originY > BARREL_MIN_Y:
+                return True
+        return False
 
     def has_blue_barrel(self):
         """returns true if a barrel is held by the kicker"""
-        ai_objects = list(self.vision.get_data(AiVision.ALL_AIOBJS))
-        has_barrel = False
-        for object in range(len(ai_objects)):
-            cx = ai_objects[object].originX + ai_objects[object].width/2
-            if ai_objects[object].classname in ["BlueBarrel"] and \
+        for obj in self.vision.get_data(AiVision.ALL_AIOBJS):
+            cx = obj.originX + obj.width * 0.5
+            if obj.classname == "BlueBarrel" and \
                BARREL_MIN_CX < cx < BARREL_MAX_CX and \
-               ai_objects[object].originY > BARREL_MIN_Y:
-                has_barrel = True
-        return has_barrel
+               obj.originY > BARREL_MIN_Y:
+                return True
+        return False
 
     def has_orange_barrel(self):
         """returns true if a barrel is held by the kicker"""
-        ai_objects = list(self.vision.get_data(AiVision.ALL_AIOBJS))
-        has_barrel = False
-        for object in range(len(ai_objects)):
-            cx = ai_objects[object].originX + ai_objects[object].width/2
-            if ai_objects[object].classname in ["OrangeBarrel"] and \
+        for obj in self.vision.get_data(AiVision.ALL_AIOBJS):
+            cx = obj.originX + obj.width * 0.5
+            if obj.classname == "OrangeBarrel" and \
                BARREL_MIN_CX < cx < BARREL_MAX_CX and \
-               ai_objects[object].originY > BARREL_MIN_Y :
-                has_barrel = True
-        return has_barrel
+               obj.originY > BARREL_MIN_Y:
+                return True
+        return False
 
     def has_sports_ball(self):
         """returns true if a ball is held by the kicker"""
-        ai_objects = list(self.vision.get_data(AiVision.ALL_AIOBJS))
-        has_ball = False
-        for object in range(len(ai_objects)):
-            cx = ai_objects[object].originX + ai_objects[object].width/2
-            if ai_objects[object].classname in ["SportsBall"] and \
+        for obj in self.vision.get_data(AiVision.ALL_AIOBJS):
+            cx = obj.originX + obj.width * 0.5
+            if obj.classname == "SportsBall" and \
                BALL_MIN_CX < cx < BALL_MAX_CX and \
-               ai_objects[object].originY > BALL_MIN_Y :
-                has_ball = True
-        return has_ball
+               obj.originY > BALL_MIN_Y:
+                return True
+        return False
     #endregion Vision Commands
 class Inertial():
     """ AIM Inertial class.  Provides methods to interact with the robot's inertial sensor."""
@@ -1232,8 +1343,8 @@ class Inertial():
         """reports whether the gyro is calibrating."""
         if self.robot_instance._ws_status_thread.imu_cal_flag_needs_setting == True:
             return True
-        robot_flags = self.robot_instance._ws_status_thread.current_status["robot"]["flags"]
-        calibrating = bool(int(robot_flags, 16) & SYS_FLAGS_IMU_CAL)
+        robot_flags = self.robot_instance._ws_status_thread.current_status["robot"]["flags_int"]
+        calibrating = bool(robot_flags & SYS_FLAGS_IMU_CAL)
         return calibrating
     #endregion Inertial - Getters
     #region Inertial - Callbacks
@@ -1257,16 +1368,10 @@ class Screen():
 
     def _return_rgb(self, color):
         if isinstance(color, (vex.Color, vex.Color.DefinedColor)):
-            r = (color.value >> 16) & 0xFF
-            g = (color.value >>  8) & 0xFF
-            b =  color.value & 0xFF
-        elif isinstance(color, int):
-            r = (color >> 16) & 0xFF
-            g = (color >>  8) & 0xFF
-            b =  color & 0xFF
-        else:
-            raise AimException("parameter must be a vex.Color instance or int rgb value")
-        return r,g,b
+            return color.channels()
+        if isinstance(color, int):
+            return (color >> 16) & 0xFF, (color >> 8) & 0xFF, color & 0xFF
+        raise AimException("parameter must be a vex.Color instance or int rgb value")
 
     def _return_transparency(self, color):
         if isinstance(color, (vex.Color, vex.Color.DefinedColor)):
@@ -1418,8 +1523,8 @@ class Screen():
     def show_file(self, filename: str, x: int, y: int):
         """draws a custom user-uploaded image on the robot’s screen at the specified (x, y) screen coordinate"""
         #TODO: alowed extensions are correct?
-        if filename[-3:] not in ("bmp", "png"):
-            raise InvalidImageFileException(f"extension is {filename[-3:]}; expected extension to be bmp or png")
+        if not filename.lower().endswith((".bmp", ".png")):
+            raise InvalidImageFileException(f"filename is {filename}; expected extension to be bmp or png")
 
         message = commands.ScreenDrawImageFromFile(filename, x, y)
         self.robot_instance.robot_send(message.to_json())
@@ -1429,7 +1534,7 @@ class Screen():
         defines a rectangular area on the screen where all drawings and text will be confined. Any content outside this region will not be displayed
         """
         message = commands.ScreenSetClipRegion(x, y, width, height)
-        self.robot_instance.robot_send(message.to_json())
+        self.robot_instance.robot_send(message.to_json(), dedupe=True)
     #endregion Screen - Draw
     #region Screen - Emoji
     def show_emoji(self, emoji: vex.EmojiType, look: vex.EmojiLookType = vex.EmojiLookType.LOOK_FORWARD):
@@ -1439,8 +1544,9 @@ class Screen():
 
     def hide_emoji(self):
         """hide emoji from being displayed, so that any underlying graphics can be viewed"""
-        message = commands.ScreenHideEmoji()
-        self.robot_instance.robot_send(message.to_json())
+        # no dedupe: show_emoji toggles this state under a different cmd_id,
+        # so the cache cannot tell a redundant hide from a needed one
+        self.robot_instance.robot_send_raw(_MSG_HIDE_EMOJI, "hide_emoji")
     #endregion Screen - Emoji
     #region Screen - Callbacks
     def pressed(self, callback: Callable[...,None], arg: tuple=()):
@@ -1455,7 +1561,7 @@ class Screen():
     #region Screen - Touch
     def pressing(self):
         """returns true if the screen is being pressed"""
-        is_pressing = bool(int(self.robot_instance.status["robot"]["touch_flags"], 16) & 0x0001)
+        is_pressing = bool(self.robot_instance.status["robot"]["touch_flags_int"] & 0x0001)
         return is_pressing
 
     def x_position(self):
@@ -1471,13 +1577,13 @@ class Screen():
     #region Screen - Vision
     def show_aivision(self):
         """show the aivision output on the screen"""
-        message = commands.ScreenShowAivision()
-        self.robot_instance.robot_send(message.to_json())
+        self.robot_instance.robot_send_raw(_MSG_SHOW_AIVISION, "show_aivision")
 
     def hide_aivision(self):
         """hide the aivision output"""
-        message = commands.ScreenHideAivision()
-        self.robot_instance.robot_send(message.to_json())
+        # no dedupe: show_aivision toggles this state under a different cmd_id,
+        # so the cache cannot tell a redundant hide from a needed one
+        self.robot_instance.robot_send_raw(_MSG_HIDE_AIVISION, "hide_aivision")
     #endregion Screen - Vision
 
 class Kicker():
@@ -1494,10 +1600,15 @@ class Kicker():
     def place(self):
         """activates the Kicker in order to place an object gently in front of the robot"""
         # json = {"cmd_id": "push"}
-        self.kick(vex.KickType.SOFT)
+        self.robot_instance.robot_send_raw(_MSG_KICK_SOFT, "kick_soft")
+
+# note letter -> MIDI note number, and accidental -> semitone offset;
+# table lookups instead of an if/elif chain per note played
+_NOTE_MAP = {'c': 0, 'd': 2, 'e': 4, 'f': 5, 'g': 7, 'a': 9, 'b': 11}
+_ACCIDENTAL_MAP = {'#': 1, 'b': -1}
 
 class Sound():
-    """ 
+    """
     Sound class for accessing the robot's sound features like playing built-in and uploaded sounds
     """
     def __init__(self, robot_instance: Robot):
@@ -1506,52 +1617,29 @@ class Sound():
         """
         Converts a musical note string (e.g., "C#5") into a MIDI note number (0-11) and octave.
         """
-       # Check at least one character is present
-        if len(note_str) < 1:
+        length = len(note_str)
+        if length < 2:
             raise TypeError("invalid note string")
 
         # Map first character to note
-        c = note_str[0].lower()
-        if c == 'c':
-            note = 0
-        elif c == 'd':
-            note = 2
-        elif c == 'e':
-            note = 4
-        elif c == 'f':
-            note = 5
-        elif c == 'g':
-            note = 7
-        elif c == 'a':
-            note = 9
-        elif c == 'b':
-            note = 11
-        else:
+        note = _NOTE_MAP.get(note_str[0].lower())
+        if note is None:
             raise TypeError("invalid note string")
 
-        octave = 0
-
         # If length=2, second char should be the octave 5–8
-        if len(note_str) == 2:
-            if note_str[1] < '5' or note_str[1] > '8':
+        if length == 2:
+            if not '5' <= note_str[1] <= '8':
                 raise TypeError("invalid note string")
             octave = int(note_str[1]) - 5
-            if octave < 0:
-                octave = 0
 
         # If length=3, middle char should be '#' or 'b', last char is octave 5–8
-        elif len(note_str) == 3:
-            if (note_str[2] < '5' or note_str[2] > '8' or (note_str[1] not in ('#', 'b'))):
+        elif length == 3:
+            accidental = _ACCIDENTAL_MAP.get(note_str[1])
+            if accidental is None or not '5' <= note_str[2] <= '8':
                 raise TypeError("invalid note string")
-            accidental = note_str[1]
-            if accidental == '#' and note < 11:
-                note += 1
-            elif accidental == 'b' and note > 0:
-                note -= 1
-
+            # clamp to the valid 0-11 note range
+            note = min(11, max(0, note + accidental))
             octave = int(note_str[2]) - 5
-            if octave < 0:
-                octave = 0
         else:
             raise TypeError("invalid note string")
 
@@ -1582,46 +1670,50 @@ class Sound():
         """play a WAV or MP3 file stored on the client side; file will be transmitted to robot\n
            Maximum filesize is 255 KB"""
         file = pathlib.Path(filepath)
+        extension = file.suffix.lower()
+        filename = file.name
+        # validate the extension before touching the filesystem
+        if extension not in (".wav", ".mp3"):
+            raise InvalidSoundFileException(f"extension is {file.suffix}; expected extension to be wav or mp3")
+
         size = file.stat().st_size
         if size > SOUND_SIZE_MAX_BYTES:
             raise InvalidSoundFileException(f"file size of {size} bytes is too big; max size allowed is {SOUND_SIZE_MAX_BYTES} bytes ({SOUND_SIZE_MAX_BYTES/1024:.1f} kB)")
-
-        extension = file.suffix
-        filename = file.name
-        audio = bytearray(64)
-        if not (extension == ".wav" or extension == ".mp3"):
-            raise InvalidSoundFileException(f"extension is {extension}; expected extension to be wav or mp3")
         try:
             f = open(filepath, 'rb')
         except FileNotFoundError:
             print ("File", filepath, "was not found")
         else:
             with f:
-                data = f.read()
-
-            # do some sanity checks to make sure it's really a wave:
-            if extension == ".wav":
-                if not (data[0:4] == b'RIFF' and data[8:12] == b'WAVE'):
-                    raise InvalidSoundFileException("file extension was .wav but does not appear to actually be a WAVE file")
-                channels = int.from_bytes(data[22:24], "little")
-                if channels > 2:
-                    raise InvalidSoundFileException(f"only mono or stereo is supported, detected {channels} channels.")
-                if channels == 2:
-                    print("%s is stereo; mono is recommended")
-                # first 64 bytes of audio is header
-                audio[0:1] = (0).to_bytes(1, 'little')
-
-            # assuming the mp3 is valid:
-            elif extension == ".mp3":
-                audio[0:1] = (1).to_bytes(1, 'little')
-
-            # set volume
-            audio[1:2] = (volume).to_bytes(1, 'little')
-
-            audio[4:8] = (len(data)).to_bytes(4, 'little') # length of data
-            audio[8:12] = (0).to_bytes(4, 'little') # file chunk number
-            audio[32:32+len(filename)] = map(ord, filename[:32]) # filename
-            audio.extend(data) # append the data
+                # read just enough for the sanity checks before pulling in the
+                # rest of the file, so a bad header fails without a full read
+                header = f.read(24)
+
+                # do some sanity checks to make sure it's really a wave:
+                if extension == ".wav":
+                    mv = memoryview(header)
+                    if not (header.startswith(b'RIFF') and mv[8:12] == b'WAVE'):
+                        raise InvalidSoundFileException("file extension was .wav but does not appear to actually be a WAVE file")
+                    channels = int.from_bytes(mv[22:24], "little")
+                    if channels > 2:
+                        raise InvalidSoundFileException(f"only mono or stereo is supported, detected {channels} channels.")
+                    if channels == 2:
+                        print("%s is stereo; mono is recommended")
+                    audio_format = 0
+                # assuming the mp3 is valid:
+                else:
+                    audio_format = 1
+
+                data = header + f.read()
+
+            # first 64 bytes of audio is header; allocate header + data up front
+            # instead of growing the buffer with extend()
+            audio = bytearray(64 + len(data))
+            # format, volume, data length, file chunk number
+            struct.pack_into('<BBxxII', audio, 0, audio_format, volume, len(data), 0)
+            # filename: encode straight to bytes, zero-padded to the 32-byte field
+            audio[32:64] = filename[:32].encode('ascii', 'ignore').ljust(32, b'\x00')
+            audio[64:] = data
             self.robot_instance.robot_send_audio(audio)
             self.__set_sound_active()
 
@@ -1648,8 +1740,8 @@ class Sound():
 
     def is_active(self):
         """returns true if sound is currently playing or if it is being transmitted for playing"""
-        robot_flags = self.robot_instance.status["robot"]["flags"]
-        sound_active = bool(int(robot_flags, 16) & SYS_FLAGS_SOUND_PLAYING) or bool(int(robot_flags, 16) & SYS_FLAGS_IS_SOUND_DNL)
+        robot_flags = self.robot_instance.status["robot"]["flags_int"]
+        sound_active = bool(robot_flags & (SYS_FLAGS_SOUND_PLAYING | SYS_FLAGS_IS_SOUND_DNL))
         return sound_active
 
     def stop(self):
@@ -1657,8 +1749,7 @@ class Sound():
         stops a sound that is currently playing.  
         It will take some time for the sound to actually stop playing.
         """
-        message = commands.SoundStop()
-        self.robot_instance.robot_send(message.to_json())
+        self.robot_instance.robot_send_raw(_MSG_SOUND_STOP, "stop_sound")
 
 class Led():
     """ Led class for accessing the robot's LED features like setting the color of the LEDs"""
@@ -1694,9 +1785,7 @@ class Led():
 
         if len(args) == 2:
             if isinstance(args[1], (vex.Color, vex.Color.DefinedColor)):
-                r = (args[1].value >> 16) & 0xFF
-                g = (args[1].value >>  8) & 0xFF
-                b =  args[1].value & 0xFF
+                r, g, b = args[1].rgb
             elif isinstance(args[1], (bool)): # turn white if True, off if False
                 r = 128 if args[1] else 0
                 g = 128 if args[1] else 0
@@ -1721,7 +1810,7 @@ class Led():
     def off(self, led: vex.LightType):
         """turns off the specified LED"""
         message = commands.LedSet(led, 0, 0, 0)
-        self.robot_instance.robot_send(message.to_json())
+        self.robot_instance.robot_send(message.to_json(), dedupe=True)
 
 class Colordesc:
     '''### Colordesc class - a class for holding an AI vision sensor color definition
@@ -1857,6 +1946,72 @@ class _ObjectTypeMask:
     tagObject    = (1 << 3)
     allObject    = (0x3F)
 
+# maps a descriptor class to its object type mask so get_data can classify
+# with one dict lookup instead of a chain of isinstance checks
+_TYPE_DISPATCH = {
+    Colordesc: _ObjectTypeMask.colorObject,
+    Codedesc:  _ObjectTypeMask.codeObject,
+    AiObjdesc: _ObjectTypeMask.modelObject,
+    Tagdesc:   _ObjectTypeMask.tagObject,
+    ObjDesc:   _ObjectTypeMask.allObject,
+}
+
+def _type_mask_of(desc):
+    """object type mask for a descriptor; the exact class hits the dispatch
+    dict on the first mro entry, and walking the rest keeps descriptor
+    subclasses matching like the original isinstance chain did"""
+    for klass in desc.__class__.__mro__:
+        mask = _TYPE_DISPATCH.get(klass)
+        if mask is not None:
+            return mask
+    return _ObjectTypeMask.allObject
+
+# per-type field extractors for get_data; one dict dispatch per item replaces
+# testing every object against every type branch
+def _extract_color(obj, it, classnames_items):
+    obj.angle = it["angle"] * 0.01
+
+def _extract_code(obj, it, classnames_items):
+    obj.angle = it["angle"] * 0.01
+
+def _extract_model(obj, it, classnames_items): #AI model objects can have a classname
+    obj.classname = AiVisionObject._intern_classname(classnames_items[obj.id]["name"])
+    obj.score = it["score"]
+
+def _extract_tag(obj, it, classnames_items):
+    obj.tag.x = _TAG_X(it)
+    obj.tag.y = _TAG_Y(it)
+
+_AIVISION_EXTRACTORS = {
+    _ObjectTypeMask.colorObject: _extract_color,
+    _ObjectTypeMask.codeObject:  _extract_code,
+    _ObjectTypeMask.modelObject: _extract_model,
+    _ObjectTypeMask.tagObject:   _extract_tag,
+}
+
+# grab all four tag corner coordinates in one C-level call per axis
+_TAG_X = itemgetter("x0", "x1", "x2", "x3")
+_TAG_Y = itemgetter("y0", "y1", "y2", "y3")
+
+def _compute_derived(ox, oy, w, h):
+    """compute the derived centerX/centerY/area/bearing columns for a frame"""
+    cx = ox + (w >> 1)
+    cy = oy + (h >> 1)
+    area = w * h
+    bearing = (-34.656 + (cx * 0.22539) + (cy * 0.011526)
+               + (cx * cx * -0.000042011) + (cx * cy * 0.000010433)
+               + (cy * cy * -0.00007073))
+    return cx, cy, area, bearing
+
+# JIT-compile the per-frame kernel when numba is available; the plain
+# numpy version above is already vectorized and remains the fallback
+try:
+    from numba import njit
+except ImportError:
+    pass
+else:
+    _compute_derived = njit(cache=True, fastmath=True)(_compute_derived)
+
 MATCH_ALL_ID = 0xFFFF
 class AiVision():
     """ 
@@ -1908,115 +2063,100 @@ class AiVision():
         ```
         '''
         match_tuple=None
-        if isinstance(type, Colordesc):
-            type_mask = _ObjectTypeMask.colorObject
-            id = type.id
-        elif isinstance(type, Codedesc):
-            type_mask = _ObjectTypeMask.codeObject
-            id = type.id
-        elif isinstance(type, AiObjdesc):
-            type_mask = _ObjectTypeMask.modelObject
-            id = type.id
-        elif isinstance(type, Tagdesc):
-            type_mask = _ObjectTypeMask.tagObject
-            id = type.id
-        elif isinstance(type, ObjDesc):
-            type_mask = _ObjectTypeMask.allObject
-            id = type.id
-        elif isinstance(type, tuple):
+        if isinstance(type, tuple):
             match_tuple = type
             if not match_tuple:
                 raise AimException("tuple passed to get_data is empty")
             type_mask = _ObjectTypeMask.allObject
         else:
-            type_mask = _ObjectTypeMask.allObject # default value, changed to match uP by James
-            id = type # assume the first argument is any object id including match all.
+            # unknown types fall back to allObject and are assumed to be a
+            # bare object id (including match all)
+            type_mask = _type_mask_of(type)
+            id = getattr(type, 'id', type)
 
         if count > AIVISION_MAX_OBJECTS:
             count = AIVISION_MAX_OBJECTS
 
         objects = self.robot_instance.status["aivision"]["objects"]
         item_count = objects["count"]
+        items = objects["items"]
+        # most frames have nothing in view; skip all the per-frame work
+        if item_count == 0:
+            self._object_count_val = 0
+            self._largest_object = None
+            return []
+        # Struct-of-Arrays pass: gather the geometry columns into ndarrays once,
+        # then compute the derived centerX/centerY/area/bearing fields as
+        # vectorized C-level ops instead of ~8 Python arithmetic ops per item.
+        ox = np.fromiter((items[item]["originx"] for item in range(item_count)), dtype=np.int32, count=item_count)
+        oy = np.fromiter((items[item]["originy"] for item in range(item_count)), dtype=np.int32, count=item_count)
+        w  = np.fromiter((items[item]["width"]   for item in range(item_count)), dtype=np.int32, count=item_count)
+        h  = np.fromiter((items[item]["height"]  for item in range(item_count)), dtype=np.int32, count=item_count)
+        cx, cy, area, bearing = _compute_derived(ox, oy, w, h)
+
+        classnames_items = self.robot_instance.status["aivision"]["classnames"]["items"]
         ai_object_list = [AiVisionObject() for item in range(item_count)]
-        # first just extract everything we got from ws_status
+        # materialize the per-object fields from the SoA columns; bind the item
+        # dict and the target object to locals once instead of re-indexing
+        # items[item] / ai_object_list[item] for every field
         for item in range(item_count):
-            ai_object_list[item].type       = objects["items"][item]["type"]
-            ai_object_list[item].id         = objects["items"][item]["id"]
-            ai_object_list[item].originX    = objects["items"][item]["originx"]
-            ai_object_list[item].originY    = objects["items"][item]["originy"]
-            ai_object_list[item].width      = objects["items"][item]["width"]
-            ai_object_list[item].height     = objects["items"][item]["height"]
-            ai_object_list[item].centerX    = int(ai_object_list[item].originX + (ai_object_list[item].width/2))
-            ai_object_list[item].centerY    = int(ai_object_list[item].originY + (ai_object_list[item].height/2))
-
-            if ai_object_list[item].type ==  _ObjectTypeMask.colorObject:
-                ai_object_list[item].angle = objects["items"][item]["angle"] * 0.01
-
-            if ai_object_list[item].type ==  _ObjectTypeMask.codeObject:
-                ai_object_list[item].angle = objects["items"][item]["angle"] * 0.01
-
-            if ai_object_list[item].type ==  _ObjectTypeMask.modelObject: #AI model objects can have a classname
-                ai_object_list[item].classname  = self.robot_instance.status["aivision"]["classnames"]["items"][ai_object_list[item].id]["name"]
-                ai_object_list[item].score = objects["items"][item]["score"]
-
-            if ai_object_list[item].type ==  _ObjectTypeMask.tagObject:
-                ai_object_list[item].tag.x = (objects["items"][item]["x0"],objects["items"][item]["x1"],objects["items"][item]["x2"],objects["items"][item]["x3"])
-                ai_object_list[item].tag.y = (objects["items"][item]["y0"],objects["items"][item]["y1"],objects["items"][item]["y2"],objects["items"][item]["y3"])
-
-            ai_object_list[item].rotation = ai_object_list[item].angle
-            ai_object_list[item].area = ai_object_list[item].width * ai_object_list[item].height
-            cx = ai_object_list[item].centerX
-            cy = ai_object_list[item].centerY
-            ai_object_list[item].bearing = -34.656 + (cx * 0.22539) + (cy * 0.011526) + (cx * cx * -0.000042011) + (cx * cy * 0.000010433) + (cy * cy * -0.00007073)
+            it  = items[item]
+            obj = ai_object_list[item]
+            obj.type       = it["type"]
+            obj.id         = it["id"]
+            obj.originX    = int(ox[item])
+            obj.originY    = int(oy[item])
+            obj.width      = int(w[item])
+            obj.height     = int(h[item])
+            obj.centerX    = int(cx[item])
+            obj.centerY    = int(cy[item])
+
+            extractor = _AIVISION_EXTRACTORS.get(obj.type)
+            if extractor is not None:
+                extractor(obj, it, classnames_items)
+
+            obj.rotation = obj.angle
+            obj.area = int(area[item])
+            obj.bearing = float(bearing[item])
 
         # print("diagnostic: ai_object_list: ", ai_object_list)
-        num_matches = 0
-        sublist = []
+        match_specs = None
+        if match_tuple:
+            # classify each tuple member once (type mask + id) up front instead
+            # of re-running an isinstance chain per member per item
+            match_specs = [(_type_mask_of(obj), int(getattr(obj, 'id', obj)))
+                           for obj in match_tuple]
+
+        matches = []
         for item in range(item_count):
+            obj = ai_object_list[item]
             match_found = False
-            if match_tuple:
+            if match_specs:
                 # check all tuple members for a match
-                for obj in match_tuple:
-                    if isinstance(obj, Colordesc):
-                        if ai_object_list[item].type == _ObjectTypeMask.colorObject and (ai_object_list[item].id == obj.id or MATCH_ALL_ID == obj.id):
-                            match_found = True
-                    elif isinstance(obj, Codedesc):
-                        if ai_object_list[item].type == _ObjectTypeMask.codeObject and (ai_object_list[item].id == obj.id or MATCH_ALL_ID == obj.id):
-                            match_found = True
-                    elif isinstance(obj, AiObjdesc):
-                        if ai_object_list[item].type == _ObjectTypeMask.modelObject and (ai_object_list[item].id == obj.id or MATCH_ALL_ID == obj.id):
-                            match_found = True
-                    elif isinstance(obj, Tagdesc):
-                        if ai_object_list[item].type == _ObjectTypeMask.tagObject and (ai_object_list[item].id == obj.id or MATCH_ALL_ID == obj.id):
-                            match_found = True
-                    elif isinstance(obj, ObjDesc):
-                        if ai_object_list[item].id == obj.id or MATCH_ALL_ID == obj.id:
-                            match_found = True
-                    else:
-                        # assume obj is an int
-                        if ai_object_list[item].id == int(obj) or MATCH_ALL_ID == int(obj):
-                            match_found = True
+                for (member_mask, member_id) in match_specs:
+                    if obj.type & member_mask and \
+                       (obj.id == member_id or MATCH_ALL_ID == member_id):
+                        match_found = True
+                        break
             else:
-                if ai_object_list[item].id == id or MATCH_ALL_ID == id:
+                if obj.id == id or MATCH_ALL_ID == id:
                     match_found = True
 
-            if ai_object_list[item].type & type_mask:
+            if obj.type & type_mask:
                 if match_found:
-                    num_matches += 1
-                    #sort objects by object area in descending order
-                    current_object_area = ai_object_list[item].height * ai_object_list[item].width
-                    current_object_smallest = True
-                    for i in range(len(sublist)):
-                        if current_object_area >= (sublist[i].width * sublist[i].height):
-                            sublist.insert(i, ai_object_list[item]) # insert item at position i of sublist.
-                            current_object_smallest = False
-                            break
-                    if current_object_smallest:
-                        sublist.append(ai_object_list[item]) #add to the end
+                    matches.append(item)
 
+        num_matches = len(matches)
         if num_matches > count:
             num_matches = count
 
+        #sort matches by object area in descending order with one C-level argsort
+        if matches:
+            order = np.argsort(area[matches], kind='stable')[::-1]
+            sublist = [ai_object_list[matches[i]] for i in order]
+        else:
+            sublist = []
+
         self._object_count_val = num_matches
         if sublist:
             self._largest_object = sublist[0]
@@ -2057,7 +2197,7 @@ class AiVision():
             None
         '''
         message = commands.VisionTagDetection(enable)
-        self.robot_instance.robot_send(message.to_json())
+        self.robot_instance.robot_send(message.to_json(), dedupe=True)
 
     def color_detection(self, enable: bool, merge: bool = False):
         '''### Enable or disable color and code object processing
@@ -2070,7 +2210,7 @@ class AiVision():
             None
         '''
         message = commands.VisionColorDetection(enable, merge)
-        self.robot_instance.robot_send(message.to_json())
+        self.robot_instance.robot_send(message.to_json(), dedupe=True)
 
     def model_detection(self, enable: bool):
         '''### Enable or disable AI model object processing
@@ -2082,7 +2222,7 @@ class AiVision():
             None
         '''
         message = commands.VisionModelDetection(enable)
-        self.robot_instance.robot_send(message.to_json())
+        self.robot_instance.robot_send(message.to_json(), dedupe=True)
 
     def color_description(self, desc: Colordesc):
         '''### set a new color description
@@ -2127,8 +2267,14 @@ class AiVision():
             raise NoImageException("no image was received")
         return image
 
+# canonical apriltag descriptors, indexable by numeric tag id in O(1)
+# (e.g. _TAGS[tag_id] for an id received off the wire)
+_TAGS = tuple(Tagdesc(i) for i in range(38))
+
 class VisionObject:
     '''### VisionObject class - a class with some predefined objects for get_data'''
+    TAGS = _TAGS
+    '''tuple of all apriltag descriptions, indexable by tag id'''
     SPORTS_BALL = AiObjdesc(0)
     '''A description for get_data indicating the AI ball objects to be returned'''
     BLUE_BARREL = AiObjdesc(1)
@@ -2137,82 +2283,12 @@ class VisionObject:
     '''A description for get_data indicating the AI orange barrel objects to be returned'''
     AIM_ROBOT = AiObjdesc(3)
     '''A description for get_data indicating the AI robot objects to be returned'''
-    TAG0 = Tagdesc(0)
-    '''A description for get_data indicating apriltags with id 0 to be returned'''
-    TAG1 = Tagdesc(1)
-    '''A description for get_data indicating apriltags with id 1 to be returned'''
-    TAG2 = Tagdesc(2)
-    '''A description for get_data indicating apriltags with id 2 to be returned'''
-    TAG3 = Tagdesc(3)
-    '''A description for get_data indicating apriltags with id 3 to be returned'''
-    TAG4 = Tagdesc(4)
-    '''A description for get_data indicating apriltags with id 4 to be returned'''
-    TAG5 = Tagdesc(5)
-    '''A description for get_data indicating apriltags with id 5 to be returned'''
-    TAG6 = Tagdesc(6)
-    '''A description for get_data indicating apriltags with id 6 to be returned'''
-    TAG7 = Tagdesc(7)
-    '''A description for get_data indicating apriltags with id 7 to be returned'''
-    TAG8 = Tagdesc(8)
-    '''A description for get_data indicating apriltags with id 8 to be returned'''
-    TAG9 = Tagdesc(9)
-    '''A description for get_data indicating apriltags with id 9 to be returned'''
-    TAG10 = Tagdesc(10)
-    '''A description for get_data indicating apriltags with id 10 to be returned'''
-    TAG11 = Tagdesc(11)
-    '''A description for get_data indicating apriltags with id 11 to be returned'''
-    TAG12 = Tagdesc(12)
-    '''A description for get_data indicating apriltags with id 12 to be returned'''
-    TAG13 = Tagdesc(13)
-    '''A description for get_data indicating apriltags with id 13 to be returned'''
-    TAG14 = Tagdesc(14)
-    '''A description for get_data indicating apriltags with id 14 to be returned'''
-    TAG15 = Tagdesc(15)
-    '''A description for get_data indicating apriltags with id 15 to be returned'''
-    TAG16 = Tagdesc(16)
-    '''A description for get_data indicating apriltags with id 16 to be returned'''
-    TAG17 = Tagdesc(17)
-    '''A description for get_data indicating apriltags with id 17 to be returned'''
-    TAG18 = Tagdesc(18)
-    '''A description for get_data indicating apriltags with id 18 to be returned'''
-    TAG19 = Tagdesc(19)
-    '''A description for get_data indicating apriltags with id 19 to be returned'''
-    TAG20 = Tagdesc(20)
-    '''A description for get_data indicating apriltags with id 20 to be returned'''
-    TAG21 = Tagdesc(21)
-    '''A description for get_data indicating apriltags with id 21 to be returned'''
-    TAG22 = Tagdesc(22)
-    '''A description for get_data indicating apriltags with id 22 to be returned'''
-    TAG23 = Tagdesc(23)
-    '''A description for get_data indicating apriltags with id 23 to be returned'''
-    TAG24 = Tagdesc(24)
-    '''A description for get_data indicating apriltags with id 24 to be returned'''
-    TAG25 = Tagdesc(25)
-    '''A description for get_data indicating apriltags with id 25 to be returned'''
-    TAG26 = Tagdesc(26)
-    '''A description for get_data indicating apriltags with id 26 to be returned'''
-    TAG27 = Tagdesc(27)
-    '''A description for get_data indicating apriltags with id 27 to be returned'''
-    TAG28 = Tagdesc(28)
-    '''A description for get_data indicating apriltags with id 28 to be returned'''
-    TAG29 = Tagdesc(29)
-    '''A description for get_data indicating apriltags with id 29 to be returned'''
-    TAG30 = Tagdesc(30)
-    '''A description for get_data indicating apriltags with id 30 to be returned'''
-    TAG31 = Tagdesc(31)
-    '''A description for get_data indicating apriltags with id 31 to be returned'''
-    TAG32 = Tagdesc(32)
-    '''A description for get_data indicating apriltags with id 32 to be returned'''
-    TAG33 = Tagdesc(33)
-    '''A description for get_data indicating apriltags with id 33 to be returned'''
-    TAG34 = Tagdesc(34)
-    '''A description for get_data indicating apriltags with id 34 to be returned'''
-    TAG35 = Tagdesc(35)
-    '''A description for get_data indicating apriltags with id 35 to be returned'''
-    TAG36 = Tagdesc(36)
-    '''A description for get_data indicating apriltags with id 36 to be returned'''
-    TAG37 = Tagdesc(37)
-    '''A description for get_data indicating apriltags with id 37 to be returned'''
+    # TAG0..TAG37 are generated in one loop rather than 38 hand-written
+    # assignments; each is a description for get_data indicating apriltags
+    # with that id to be returned
+    for _i in range(38):
+        locals()[f'TAG{_i}'] = _TAGS[_i]
+    del _i
     ALL_TAGS = Tagdesc(MATCH_ALL_ID)
     '''A description for get_data indicating any apriltag to be returned'''
     ALL_VISION = ObjDesc(MATCH_ALL_ID)
@@ -2223,14 +2299,34 @@ class VisionObject:
     '''A description for get_data indicating AI ball or barrel to be returned'''
 
 class AiVisionObject():
-    """ 
+    """
     AiVisionObject class - a class for holding AI vision sensor object properties
     """
+    # instances are created in bulk every vision frame, so store the fields in
+    # slots rather than a per-instance dict
+    __slots__ = ('type', 'id', 'originX', 'originY', 'centerX', 'centerY',
+                 'width', 'height', 'exists', 'angle', 'rotation', 'score',
+                 'area', 'bearing', 'classname', 'color', 'tag')
+
+    # classnames come from a small vocabulary repeated across every detection;
+    # interning shares one str object per name and makes == a pointer compare
+    _CLASSNAME_POOL = {}
+
+    @classmethod
+    def _intern_classname(cls, name):
+        pool = cls._CLASSNAME_POOL
+        interned = pool.get(name)
+        if interned is None:
+            interned = pool[name] = sys.intern(name)
+        return interned
+
     class Tag:
         """
         Tag class - a class for holding AI vision sensor tag properties
         The tag class is used to hold the coordinates of the four corners of the tag
         """
+        __slots__ = ('x', 'y')
+
         def __init__(self):
             self.x = (0,0,0,0)
             self.y = (0,0,0,0)
@@ -2255,6 +2351,96 @@ class AiVisionObject():
         self.color     = None # not used in remote
         self.tag       = AiVisionObject.Tag()
 
+class AiVisionObjectBatch:
+    """
+    AiVisionObjectBatch class - Struct-of-Arrays container for a frame of detections
+
+    Holds one numpy column per AiVisionObject field, so batch operations over
+    many detections (filter by score, sort by area, centroid math) run as
+    vectorized numpy expressions instead of per-object attribute reads.
+    Indexing materializes a regular AiVisionObject for drop-in compatibility.
+    """
+    _INT_COLS   = ('type', 'id', 'originX', 'originY', 'centerX', 'centerY',
+                   'width', 'height', 'score', 'area')
+    _FLOAT_COLS = ('angle', 'rotation', 'bearing')
+    _COLS = _INT_COLS + _FLOAT_COLS
+
+    __slots__ = _COLS + ('exists', 'classname')
+
+    def __init__(self, count):
+        for col in self._INT_COLS:
+            setattr(self, col, np.zeros(count, dtype=np.int32))
+        for col in self._FLOAT_COLS:
+            setattr(self, col, np.zeros(count, dtype=np.float32))
+        self.exists = np.ones(count, dtype=bool)
+        self.classname = [''] * count
+
+    def __len__(self):
+        return len(self.type)
+
+    def __getitem__(self, item):
+        """materialize one detection as a plain AiVisionObject"""
+        obj = AiVisionObject()
+        for col in self._INT_COLS:
+            setattr(obj, col, int(getattr(self, col)[item]))
+        for col in self._FLOAT_COLS:
+            setattr(obj, col, float(getattr(self, col)[item]))
+        obj.exists = bool(self.exists[item])
+        obj.classname = self.classname[item]
+        return obj
+
+class _TimerScheduler:
+    """single shared daemon thread that services all Timer.event callbacks.
+
+    Pending events live in a min-heap ordered by monotonic deadline and the
+    thread sleeps exactly until the nearest deadline (or until a new event is
+    scheduled), so idle periods cost zero wakeups and expiry has no tick
+    quantization jitter.
+    """
+    def __init__(self):
+        self._heap = []
+        self._cond = threading.Condition()
+        self._thread = None
+        self._sequence = itertools.count()  # FIFO tie-break for equal deadlines
+
+    def schedule(self, callback, delay, arg=()):
+        """run callback(*arg) delay milliseconds from now"""
+        deadline = time.monotonic() + delay / 1000
+        with self._cond:
+            heapq.heappush(self._heap, (deadline, next(self._sequence), callback, arg))
+            if self._thread is None:
+                # started lazily so programs that never use Timer.event don't pay for it
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            # a new nearest deadline may need an earlier wakeup
+            self._cond.notify()
+
+    def _run(self):
+        cond = self._cond
+        heap = self._heap
+        while True:
+            with cond:
+                while True:
+                    if not heap:
+                        cond.wait()
+                        continue
+                    timeout = heap[0][0] - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    cond.wait(timeout=timeout)
+                due = []
+                now = time.monotonic()
+                while heap and heap[0][0] <= now:
+                    due.append(heapq.heappop(heap))
+            # dispatch outside the lock so callbacks can schedule more events
+            for _, _, callback, arg in due:
+                try:
+                    callback(*arg)
+                except Exception as error:
+                    print("Timer.event callback error:", error)
+
+_timer_scheduler = _TimerScheduler()
+
 class Timer:
     '''### Timer class - create a new timer
 
@@ -2273,7 +2459,7 @@ class Timer:
     ```
     '''
     def __init__(self):
-        self.start_time = time.time()
+        self.start_ns = time.monotonic_ns()
 
     def time(self, units=vex.TimeUnits.MSEC):
         '''### return the current time for this timer
@@ -2286,13 +2472,13 @@ class Timer:
 
         #### Examples:
         '''
-        elapsed_time = time.time() - self.start_time
+        elapsed_ns = time.monotonic_ns() - self.start_ns
         if units == vex.TimeUnits.SECONDS:
             # seconds as float in 2 decimal places
-            return round(elapsed_time, 2)
+            return round(elapsed_ns / 1e9, 2)
         elif units == vex.TimeUnits.MSEC:
             # miliseconds as int - no decimal
-            return int(elapsed_time * 1000)
+            return elapsed_ns // 1_000_000
         else:
             raise ValueError("Invalid time unit")
 
@@ -2307,7 +2493,7 @@ class Timer:
 
         #### Examples:
         '''
-        self.start_time = time.time()
+        self.start_ns = time.monotonic_ns()
 
     def event(self, callback: Callable[...,None], delay: int, arg: tuple=()):
         '''### register a function to be called in the future
@@ -2329,17 +2515,32 @@ class Timer:
             t1.event(foo, 1000, ('Hello',))
         ```
         '''
-        def delayed_call():
-            time.sleep(delay / 1000)
-            callback(*arg)
-
-        threading.Thread(target=delayed_call).start()
+        _timer_scheduler.schedule(callback, delay, arg)
+
+# shared worker pool for the Thread wrapper; submissions reuse pooled OS
+# threads instead of paying thread creation per call. User programs run
+# forever-looping bodies in these threads, each of which occupies a worker
+# for the program's lifetime, so the cap is generous
+_THREAD_POOL = ThreadPoolExecutor(max_workers=128, thread_name_prefix='vex')
+
+def _report_thread_exception(future):
+    # surface exceptions the way threading's default excepthook would;
+    # otherwise they sit unseen in a Future nobody holds
+    exc = future.exception()
+    if exc is not None:
+        print("Exception in Thread:", file=sys.stderr)
+        traceback.print_exception(type(exc), exc, exc.__traceback__)
 
 class Thread():
-    """ Thread class for running a function in a separate thread"""
+    """ Thread class for running a function on a shared worker pool.
+    At most 128 Threads run at once; further submissions wait for a free
+    worker"""
     def __init__(self, func, args=None):
-        if args:
-            self.t = threading.Thread(target=func, args=args)
-        else:
-            self.t = threading.Thread(target=func)
-        self.t.start()
+        self._future = _THREAD_POOL.submit(func, *(args or ()))
+        self._future.add_done_callback(_report_thread_exception)
+
+    def join(self, timeout=None):
+        """wait for the function to finish running"""
+        # exceptions are already reported by the done callback, matching
+        # threading.Thread.join which never re-raises
+        self._future.exception(timeout)
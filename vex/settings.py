@@ -9,6 +9,29 @@ Settings class to read and manage the JSON configuration file.
 """
 import json
 import os
+from functools import lru_cache
+
+# orjson parses the raw bytes with SIMD acceleration when installed; the
+# stdlib parser is a drop-in fallback
+try:
+    from orjson import loads as _parse_json
+except ImportError:
+    _parse_json = json.loads
+
+@lru_cache(maxsize=None)
+def _load_cached(file_path):
+    """
+    Load and parse the JSON configuration file, cached per path so repeated
+    Settings() constructions don't re-read the disk.
+
+    Returns:
+        dict: Dictionary containing the configuration settings.
+    """
+    try:
+        with open(file_path, 'rb') as file:
+            return _parse_json(file.read())
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {file_path}") from None
 
 class Settings:
     """
@@ -21,21 +44,19 @@ class Settings:
         """
         self.file_path = os.path.join(os.path.dirname(__file__), 'settings.json')
         self.config = self._load_settings()
+        # derive the frequently-read fields once instead of walking the config
+        # dict chain on every property access
+        connection = self.config.get('connection') or {}
+        self._host = connection.get('host', 'localhost')
 
     def _load_settings(self):
         """
-        Load the settings from the JSON configuration file.
+        Load the settings from the JSON configuration file (cached).
 
         Returns:
             dict: Dictionary containing the configuration settings.
         """
-        if not os.path.exists(self.file_path):
-            raise FileNotFoundError(f"Configuration file not found: {self.file_path}")
-
-        with open(self.file_path, 'r') as file:
-            config = json.load(file)
-        
-        return config
+        return _load_cached(self.file_path)
 
     @property
     def host(self):
@@ -45,4 +66,4 @@ class Settings:
         Returns:
             str: Host property value.
         """
-        return self.config.get('connection', {}).get('host', 'localhost')
\ No newline at end of file
+        return self._host
\ No newline at end of file
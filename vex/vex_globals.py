@@ -208,82 +208,14 @@ ORANGE_BARREL = VisionObject.ORANGE_BARREL
 '''A description for get_data indicating the AI orange barrel objects to be returned'''
 AIM_ROBOT = VisionObject.AIM_ROBOT
 '''A description for get_data indicating the AI robot objects to be returned'''
-TAG0 = VisionObject.TAG0
-'''A description for get_data indicating apriltags with id 0 to be returned'''
-TAG1 = VisionObject.TAG1
-'''A description for get_data indicating apriltags with id 1 to be returned'''
-TAG2 = VisionObject.TAG2
-'''A description for get_data indicating apriltags with id 2 to be returned'''
-TAG3 = VisionObject.TAG3
-'''A description for get_data indicating apriltags with id 3 to be returned'''
-TAG4 = VisionObject.TAG4
-'''A description for get_data indicating apriltags with id 4 to be returned'''
-TAG5 = VisionObject.TAG5
-'''A description for get_data indicating apriltags with id 5 to be returned'''
-TAG6 = VisionObject.TAG6
-'''A description for get_data indicating apriltags with id 6 to be returned'''
-TAG7 = VisionObject.TAG7
-'''A description for get_data indicating apriltags with id 7 to be returned'''
-TAG8 = VisionObject.TAG8
-'''A description for get_data indicating apriltags with id 8 to be returned'''
-TAG9 = VisionObject.TAG9
-'''A description for get_data indicating apriltags with id 9 to be returned'''
-TAG10 = VisionObject.TAG10
-'''A description for get_data indicating apriltags with id 10 to be returned'''
-TAG11 = VisionObject.TAG11
-'''A description for get_data indicating apriltags with id 11 to be returned'''
-TAG12 = VisionObject.TAG12
-'''A description for get_data indicating apriltags with id 12 to be returned'''
-TAG13 = VisionObject.TAG13
-'''A description for get_data indicating apriltags with id 13 to be returned'''
-TAG14 = VisionObject.TAG14
-'''A description for get_data indicating apriltags with id 14 to be returned'''
-TAG15 = VisionObject.TAG15
-'''A description for get_data indicating apriltags with id 15 to be returned'''
-TAG16 = VisionObject.TAG16
-'''A description for get_data indicating apriltags with id 16 to be returned'''
-TAG17 = VisionObject.TAG17
-'''A description for get_data indicating apriltags with id 17 to be returned'''
-TAG18 = VisionObject.TAG18
-'''A description for get_data indicating apriltags with id 18 to be returned'''
-TAG19 = VisionObject.TAG19
-'''A description for get_data indicating apriltags with id 19 to be returned'''
-TAG20 = VisionObject.TAG20
-'''A description for get_data indicating apriltags with id 20 to be returned'''
-TAG21 = VisionObject.TAG21
-'''A description for get_data indicating apriltags with id 21 to be returned'''
-TAG22 = VisionObject.TAG22
-'''A description for get_data indicating apriltags with id 22 to be returned'''
-TAG23 = VisionObject.TAG23
-'''A description for get_data indicating apriltags with id 23 to be returned'''
-TAG24 = VisionObject.TAG24
-'''A description for get_data indicating apriltags with id 24 to be returned'''
-TAG25 = VisionObject.TAG25
-'''A description for get_data indicating apriltags with id 25 to be returned'''
-TAG26 = VisionObject.TAG26
-'''A description for get_data indicating apriltags with id 26 to be returned'''
-TAG27 = VisionObject.TAG27
-'''A description for get_data indicating apriltags with id 27 to be returned'''
-TAG28 = VisionObject.TAG28
-'''A description for get_data indicating apriltags with id 28 to be returned'''
-TAG29 = VisionObject.TAG29
-'''A description for get_data indicating apriltags with id 29 to be returned'''
-TAG30 = VisionObject.TAG30
-'''A description for get_data indicating apriltags with id 30 to be returned'''
-TAG31 = VisionObject.TAG31
-'''A description for get_data indicating apriltags with id 31 to be returned'''
-TAG32 = VisionObject.TAG32
-'''A description for get_data indicating apriltags with id 32 to be returned'''
-TAG33 = VisionObject.TAG33
-'''A description for get_data indicating apriltags with id 33 to be returned'''
-TAG34 = VisionObject.TAG34
-'''A description for get_data indicating apriltags with id 34 to be returned'''
-TAG35 = VisionObject.TAG35
-'''A description for get_data indicating apriltags with id 35 to be returned'''
-TAG36 = VisionObject.TAG36
-'''A description for get_data indicating apriltags with id 36 to be returned'''
-TAG37 = VisionObject.TAG37
-'''A description for get_data indicating apriltags with id 37 to be returned'''
+# TAG0..TAG37 mirror VisionObject.TAGS; each is a description for get_data
+# indicating apriltags with that id to be returned
+(TAG0,  TAG1,  TAG2,  TAG3,  TAG4,  TAG5,  TAG6,  TAG7,  TAG8,  TAG9,
+ TAG10, TAG11, TAG12, TAG13, TAG14, TAG15, TAG16, TAG17, TAG18, TAG19,
+ TAG20, TAG21, TAG22, TAG23, TAG24, TAG25, TAG26, TAG27, TAG28, TAG29,
+ TAG30, TAG31, TAG32, TAG33, TAG34, TAG35, TAG36, TAG37) = VisionObject.TAGS
+TAGS = VisionObject.TAGS
+'''tuple of all apriltag descriptions, indexable by tag id'''
 
 ALL_TAGS = VisionObject.ALL_TAGS
 '''A description for get_data indicating any apriltag to be returned'''
@@ -2,48 +2,100 @@
 #  Copyright (c) Innovation First 2025. All rights reserved.
 #  Licensed under the MIT License. See License.txt in the project root for license information.
 # =================================================================================================
-""" 
+"""
 AIM WebSocket - Messages
 
-This module contains definitions for the Websocket messages. 
+This module contains definitions for the Websocket messages.
 """
+import sys
+from enum import Enum
+from functools import lru_cache
+
+from ._json import dumps as _json_dumps
+
+def encode_batch(cmds) -> bytes:
+    """serialize several commands into one batch frame in a single encoder
+    pass, matching the {"cmd_id": "batch", "items": [...]} wire format the
+    robot accepts; one WebSocket frame replaces one per command"""
+    return _json_dumps({"cmd_id": "batch", "items": [cmd.to_json() for cmd in cmds]})
+
+def _normalized_fields(fields):
+    """yield (attribute name, wire key) pairs from a _FIELDS declaration;
+    entries are plain attribute names unless the wire key differs"""
+    for field in fields:
+        if isinstance(field, tuple):
+            yield field
+        else:
+            yield field, field
+
 class VexWebSocketCommand:
-    def __init__(self, cmd_id: str):
-        self.cmd_id = cmd_id
+    # commands are created per send on hot paths; slots avoid a per-instance
+    # dict and to_json builds one dict literal instead of create+update.
+    # cmd_id lives on the class (interned below), so constructors skip a
+    # super().__init__ call and every instance shares one string
+    __slots__ = ()
+
+    cmd_id = ""
+
+    # subclasses declare _FIELDS (wire order, see _normalized_fields); class
+    # creation then generates a single-dict-literal to_json so no subclass
+    # hand-writes the same boilerplate
+    _FIELDS = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # a subclass without __slots__ silently reintroduces the per-instance
+        # dict and forfeits the whole layout optimization; fail loudly instead
+        if "__slots__" not in cls.__dict__:
+            raise TypeError(f"{cls.__name__} must declare __slots__")
+        if "cmd_id" in cls.__dict__ and isinstance(cls.cmd_id, str):
+            cls.cmd_id = sys.intern(cls.cmd_id)
+        fields = cls.__dict__.get("_FIELDS")
+        if fields is not None and "to_json" not in cls.__dict__:
+            items = ['"cmd_id": self.cmd_id']
+            items += ['"%s": self.%s' % (key, attr)
+                      for attr, key in _normalized_fields(fields)]
+            namespace = {}
+            exec("def to_json(self):\n    return {%s}" % ", ".join(items), namespace)
+            cls.to_json = namespace["to_json"]
 
     def to_json(self) -> dict:
         return {
             "cmd_id": self.cmd_id
         }
-        
+
+class _RGBMixin:
+    # shared slot layout for the commands that carry an r/g/b triple, so the
+    # attribute names are interned once instead of per class; serialization
+    # of the triple is handled by the _FIELDS-generated to_json
+    __slots__ = ("r", "g", "b")
+
 #region General Commands
 class ProgramInit(VexWebSocketCommand):
-    def __init__(self):
-        super().__init__("program_init")
+    __slots__ = ()
+    cmd_id = "program_init"
+    _FIELDS = ()
 
 
 #endregion General Commands
 
 #region Movement Commands
 class MoveAt(VexWebSocketCommand):
+    __slots__ = ("angle", "speed", "stacking_type")
+    cmd_id = "drive"
+    _FIELDS = ("angle", "speed", "stacking_type")
+
     def __init__(self, angle=0.0, speed=0.0, stacking_type=0):
-        super().__init__("drive")
         self.angle = angle
         self.speed = speed
         self.stacking_type = stacking_type
 
-    def to_json(self):
-        base_data = super().to_json()
-        base_data.update({
-            "angle": self.angle,
-            "speed": self.speed,
-            "stacking_type": self.stacking_type
-        })
-        return base_data
-
 class MoveFor(VexWebSocketCommand):
+    __slots__ = ("distance", "angle", "drive_speed", "turn_speed", "final_heading", "stacking_type")
+    cmd_id = "drive_for"
+    _FIELDS = ("distance", "angle", "final_heading", "drive_speed", "turn_speed", "stacking_type")
+
     def __init__(self, distance =0.0, angle=0.0, drive_speed=0.0, turn_speed=0.0, final_heading=0,stacking_type=0):
-        super().__init__("drive_for")
         self.distance = distance
         self.angle = angle
         self.drive_speed = drive_speed
@@ -51,288 +103,182 @@ class MoveFor(VexWebSocketCommand):
         self.final_heading = final_heading
         self.stacking_type = stacking_type
 
-    def to_json(self):
-        base_data = super().to_json()
-        base_data.update({
-            "distance": self.distance,
-            "angle": self.angle,
-            "final_heading" : self.final_heading,
-            "drive_speed": self.drive_speed,
-            "turn_speed": self.turn_speed,
-            "stacking_type": self.stacking_type
-        })
-        return base_data
-
 class MoveWithVector(VexWebSocketCommand):
-    def __init__(self, x=0, t=0, r=0):
-        super().__init__("drive_with_vector")
+    __slots__ = ("x", "t", "r")
+    cmd_id = "drive_with_vector"
+    _FIELDS = ("x", "t", "r")
+
+    def __init__(self, x=0, t=0, r=0, /):
         self.x = x
         self.t  = t
         self.r = r
 
-    def to_json(self):
-        base_data = super().to_json()
-        base_data.update({
-            "x": self.x,
-            "t": self.t,
-            "r": self.r
-        })
-        return base_data   
-
 class Turn(VexWebSocketCommand):
+    __slots__ = ("turn_rate", "stacking_type")
+    cmd_id = "turn"
+    _FIELDS = ("turn_rate", "stacking_type")
+
     def __init__(self, turn_rate=0.0, stacking_type=0):
-        super().__init__("turn")
         self.turn_rate = turn_rate
         self.stacking_type = stacking_type
 
-    def to_json(self):
-        base_data = super().to_json()
-        base_data.update({
-            "turn_rate": self.turn_rate,
-            "stacking_type": self.stacking_type
-        })
-        return base_data
-
 class TurnTo(VexWebSocketCommand):
+    __slots__ = ("heading", "turn_rate", "stacking_type")
+    cmd_id = "turn_to"
+    _FIELDS = ("heading", "turn_rate", "stacking_type")
+
     def __init__(self, heading=0.0, turn_rate=0.0, stacking_type=0):
-        super().__init__("turn_to")
         self.heading = heading
         self.turn_rate = turn_rate
         self.stacking_type = stacking_type
 
-    def to_json(self):
-        base_data = super().to_json()
-        base_data.update({
-            "heading": self.heading,
-            "turn_rate": self.turn_rate,
-            "stacking_type": self.stacking_type
-        })
-        return base_data
-    
 class TurnFor(VexWebSocketCommand):
+    __slots__ = ("angle", "turn_rate", "stacking_type")
+    cmd_id = "turn_for"
+    _FIELDS = ("angle", "turn_rate", "stacking_type")
+
     def __init__(self, angle=0, turn_rate=0.0, stacking_type=0):
-        super().__init__("turn_for")
         self.angle = angle
         self.turn_rate = turn_rate
         self.stacking_type = stacking_type
 
-    def to_json(self):
-        base_data = super().to_json()
-        base_data.update({
-            "angle": self.angle,
-            "turn_rate": self.turn_rate,
-            "stacking_type": self.stacking_type
-        })
-        return base_data
-
 class SpinWheels(VexWebSocketCommand):
-    def __init__(self, vel1=0, vel2=0, vel3=0):
-        super().__init__("spin_wheels")
+    __slots__ = ("vel1", "vel2", "vel3")
+    cmd_id = "spin_wheels"
+    _FIELDS = ("vel1", "vel2", "vel3")
+
+    def __init__(self, vel1=0, vel2=0, vel3=0, /):
         self.vel1 = vel1
         self.vel2 = vel2
         self.vel3 = vel3
 
-    def to_json(self):
-        base_data = super().to_json()
-        base_data.update({
-            "vel1": self.vel1,
-            "vel2": self.vel2,
-            "vel3": self.vel3
-        })
-        return base_data
-
 class SetPose(VexWebSocketCommand):
-    def __init__(self, x=0, y=0):
-        super().__init__("set_pose")
+    __slots__ = ("x", "y")
+    cmd_id = "set_pose"
+    _FIELDS = ("x", "y")
+
+    def __init__(self, x=0, y=0, /):
         self.x = x
         self.y = y
-        
-    def to_json(self):
-        base_data = super().to_json()
-        base_data.update({
-            "x": self.x,
-            "y": self.y
-        })
-        return base_data
 #endregion Movement Commands
 
 #region Screen Commands
 class ScreenPrint(VexWebSocketCommand):
+    __slots__ = ("string",)
+    cmd_id = "lcd_print"
+    _FIELDS = ("string",)
+
     def __init__(self, string=""):
-        super().__init__("lcd_print")
         self.string = string
 
-    def to_json(self):
-        base_data = super().to_json()
-        base_data.update({
-            "string": self.string
-        })
-        return base_data
-
 class ScreenPrintAt(VexWebSocketCommand):
+    __slots__ = ("string", "x", "y", "b_opaque")
+    cmd_id = "lcd_print_at"
+    _FIELDS = ("x", "y", "string", "b_opaque")
+
     def __init__(self, string="", x=0, y=0, b_opaque=True):
-        super().__init__("lcd_print_at")
         self.string = string
         self.x = x
         self.y = y
         self.b_opaque = b_opaque
 
-    def to_json(self):
-        base_data = super().to_json()
-        base_data.update({
-            "x": self.x,
-            "y": self.y,
-            "string": self.string,
-            "b_opaque": self.b_opaque
-        })
-        return base_data
-
 class ScreenSetCursor(VexWebSocketCommand):
+    __slots__ = ("row", "col")
+    cmd_id = "lcd_set_cursor"
+    _FIELDS = ("row", "col")
+
     def __init__(self, row=0, col=0):
-        super().__init__("lcd_set_cursor")
         self.row = row
         self.col = col
 
-    def to_json(self):
-        base_data = super().to_json()
-        base_data.update({
-            "row": self.row,
-            "col": self.col
-        })
-        return base_data
-
 class ScreenSetOrigin(VexWebSocketCommand):
+    __slots__ = ("x", "y")
+    cmd_id = "lcd_set_origin"
+    _FIELDS = ("x", "y")
+
     def __init__(self, x=0, y=0):
-        super().__init__("lcd_set_origin")
         self.x = x
         self.y = y
 
-    def to_json(self):
-        base_data = super().to_json()
-        base_data.update({
-            "x": self.x,
-            "y": self.y
-        })
-        return base_data
-
 class ScreenNextRow(VexWebSocketCommand):
-    def __init__(self):
-        super().__init__("lcd_next_row")
+    __slots__ = ()
+    cmd_id = "lcd_next_row"
+    _FIELDS = ()
 
-    def to_json(self):
-        return super().to_json()
+class ScreenClearRow(_RGBMixin, VexWebSocketCommand):
+    __slots__ = ("row",)
+    cmd_id = "lcd_clear_row"
+    _FIELDS = (("row", "number"), "r", "g", "b")
 
-class ScreenClearRow(VexWebSocketCommand):
     def __init__(self, row=0, r=0,g=0,b=0):
-        super().__init__("lcd_clear_row")
         self.row = row
         self.r = r
         self.g = g
         self.b = b
+class ScreenClear(_RGBMixin, VexWebSocketCommand):
+    __slots__ = ()
+    cmd_id = "lcd_clear_screen"
+    _FIELDS = ("r", "g", "b")
 
-    def to_json(self):
-        base_data = super().to_json()
-        base_data.update({
-            "number": self.row,
-            "r": self.r,
-            "g": self.g,
-            "b": self.b
-        })
-        return base_data
-class ScreenClear(VexWebSocketCommand):
     def __init__(self, r=0, g=0, b=0):
-        super().__init__("lcd_clear_screen")
         self.r = r
         self.g = g
         self.b = b
 
-    def to_json(self):
-        base_data = super().to_json()
-        base_data.update({
-            "r": self.r,
-            "g": self.g,
-            "b": self.b
-        })
-        return base_data
-
 class ScreenSetFont(VexWebSocketCommand):
-    def __init__(self, fontname):
-        super().__init__("lcd_set_font")
-        self.fontname = fontname
+    __slots__ = ("fontname",)
+    cmd_id = "lcd_set_font"
+    _FIELDS = ("fontname",)
 
-    def to_json(self):
-        base_data = super().to_json()
-        base_data.update({
-            "fontname": self.fontname
-        })
-        return base_data
+    def __init__(self, fontname):
+        # store the raw string so serialization never walks the Enum machinery
+        self.fontname = fontname.value if isinstance(fontname, Enum) else fontname
 
 class ScreenSetPenWidth(VexWebSocketCommand):
+    __slots__ = ("width",)
+    cmd_id = "lcd_set_pen_width"
+    _FIELDS = ("width",)
+
     def __init__(self, width):
-        super().__init__("lcd_set_pen_width")
         self.width = width
 
-    def to_json(self):
-        base_data = super().to_json()
-        base_data.update({
-            "width": self.width
-        })
-        return base_data
+class ScreenSetPenColor(_RGBMixin, VexWebSocketCommand):
+    __slots__ = ()
+    cmd_id = "lcd_set_pen_color"
+    _FIELDS = ("r", "g", "b")
 
-class ScreenSetPenColor(VexWebSocketCommand):
     def __init__(self, r=0, g=0, b=0):
-        super().__init__("lcd_set_pen_color")
         self.r = r
         self.g = g
         self.b = b
+class ScreenSetFillColor(_RGBMixin, VexWebSocketCommand):
+    __slots__ = ("b_transparency",)
+    cmd_id = "lcd_set_fill_color"
+    _FIELDS = ("r", "g", "b", "b_transparency")
 
-    def to_json(self):
-        base_data = super().to_json()
-        base_data.update({
-            "r": self.r,
-            "g": self.g,
-            "b": self.b
-        })
-        return base_data
-class ScreenSetFillColor(VexWebSocketCommand):
     def __init__(self, r=0, g=0, b=0, transparent=False):
-        super().__init__("lcd_set_fill_color")
         self.r = r
         self.g = g
         self.b = b
         self.b_transparency = transparent
 
-    def to_json(self):
-        base_data = super().to_json()
-        base_data.update({
-            "r": self.r,
-            "g": self.g,
-            "b": self.b,
-            "b_transparency":self.b_transparency
-        })
-        return base_data
-
 class ScreenDrawLine(VexWebSocketCommand):
+    __slots__ = ("x1", "y1", "x2", "y2")
+    cmd_id = "lcd_draw_line"
+    _FIELDS = ("x1", "y1", "x2", "y2")
+
     def __init__(self, x1=0, y1=0, x2=0, y2=0):
-        super().__init__("lcd_draw_line")
         self.x1 = x1
         self.y1 = y1
         self.x2 = x2
         self.y2 = y2
 
-    def to_json(self):
-        base_data = super().to_json()
-        base_data.update({
-            "x1": self.x1,
-            "y1": self.y1,
-            "x2": self.x2,
-            "y2": self.y2
-        })
-        return base_data
-
-class ScreenDrawRectangle(VexWebSocketCommand):
+class ScreenDrawRectangle(_RGBMixin, VexWebSocketCommand):
+    __slots__ = ("x", "y", "width", "height", "b_transparency")
+    cmd_id = "lcd_draw_rectangle"
+    _FIELDS = ("x", "y", "width", "height", "r", "g", "b", "b_transparency")
+
     def __init__(self, x=0, y=0, width=0, height=0, r=0, g=0, b=0, transparent=False):
-        super().__init__("lcd_draw_rectangle")
         self.x = x
         self.y = y
         self.width = width
@@ -342,23 +288,12 @@ class ScreenDrawRectangle(VexWebSocketCommand):
         self.b = b
         self.b_transparency = transparent
 
-    def to_json(self):
-        base_data = super().to_json()
-        base_data.update({
-            "x": self.x,
-            "y": self.y,
-            "width": self.width,
-            "height": self.height,
-            "r": self.r,
-            "g": self.g,
-            "b": self.b,
-            "b_transparency":self.b_transparency
-        })
-        return base_data
-
-class ScreenDrawCircle(VexWebSocketCommand):
+class ScreenDrawCircle(_RGBMixin, VexWebSocketCommand):
+    __slots__ = ("x", "y", "radius", "b_transparency")
+    cmd_id = "lcd_draw_circle"
+    _FIELDS = ("x", "y", "radius", "r", "g", "b", "b_transparency")
+
     def __init__(self, x=0, y=0, radius=0, r=0, g=0, b=0, transparent=False):
-        super().__init__("lcd_draw_circle")
         self.x = x
         self.y = y
         self.radius = radius
@@ -367,210 +302,158 @@ class ScreenDrawCircle(VexWebSocketCommand):
         self.b = b
         self.b_transparency = transparent
 
-    def to_json(self):
-        base_data = super().to_json()
-        base_data.update({
-            "x": self.x,
-            "y": self.y,
-            "radius": self.radius,
-            "r": self.r,
-            "g": self.g,
-            "b": self.b,
-            "b_transparency":self.b_transparency
-        })
-        return base_data
-
 class ScreenDrawPixel(VexWebSocketCommand):
+    __slots__ = ("x", "y")
+    cmd_id = "lcd_draw_pixel"
+    _FIELDS = ("x", "y")
+
     def __init__(self, x=0, y=0):
-        super().__init__("lcd_draw_pixel")
         self.x = x
         self.y = y
 
-    def to_json(self):
-        base_data = super().to_json()
-        base_data.update({
-            "x": self.x,
-            "y": self.y
-        })
-        return base_data
-
 class ScreenDrawImageFromFile(VexWebSocketCommand):
+    __slots__ = ("filename", "x", "y")
+    cmd_id = "lcd_draw_image_from_file"
+    _FIELDS = ("filename", "x", "y")
+
     def __init__(self, filename="", x=0, y=0):
-        super().__init__("lcd_draw_image_from_file")
         self.filename = filename
         self.x = x
         self.y = y
 
-    def to_json(self):
-        base_data = super().to_json()
-        base_data.update({
-            "filename": self.filename,
-            "x": self.x,
-            "y": self.y
-        })
-        return base_data
-
 class ScreenSetClipRegion(VexWebSocketCommand):
+    __slots__ = ("x", "y", "width", "height")
+    cmd_id = "lcd_set_clip_region"
+    _FIELDS = ("x", "y", "width", "height")
+
     def __init__(self, x=0, y=0, width=0, height=0):
-        super().__init__("lcd_set_clip_region")
         self.x = x
         self.y = y
         self.width = width
         self.height = height
 
-    def to_json(self):
-        base_data = super().to_json()
-        base_data.update({
-            "x": self.x,
-            "y": self.y,
-            "width": self.width,
-            "height": self.height
-        })
-        return base_data
-
 class ScreenShowEmoji(VexWebSocketCommand):
+    __slots__ = ("name", "look")
+    cmd_id = "show_emoji"
+    _FIELDS = ("name", "look")
+
     def __init__(self, name=0, look=0):
-        super().__init__("show_emoji")
         self.name = name
         self.look = look
 
-    def to_json(self):
-        base_data = super().to_json()
-        base_data.update({
-            "name": self.name,
-            "look": self.look
-        })
-        return base_data
-
 class ScreenHideEmoji(VexWebSocketCommand):
-    def __init__(self):
-        super().__init__("hide_emoji")
-    def to_json(self):
-        return super().to_json()
+    __slots__ = ()
+    cmd_id = "hide_emoji"
+    _FIELDS = ()
 
 class ScreenShowAivision(VexWebSocketCommand):
-    def __init__(self, name=0, look=0):
-        super().__init__("show_aivision")
-    def to_json(self):
-        return super().to_json()
+    __slots__ = ()
+    cmd_id = "show_aivision"
+    _FIELDS = ()
 
 class ScreenHideAivision(VexWebSocketCommand):
-    def __init__(self, name=0, look=0):
-        super().__init__("hide_aivision")
-    def to_json(self):
-        return super().to_json()
+    __slots__ = ()
+    cmd_id = "hide_aivision"
+    _FIELDS = ()
 #endregion Screen Commands
 
 #region Interial Commands
 class InterialCalibrate(VexWebSocketCommand):
-    def __init__(self):
-        super().__init__("imu_calibrate")
-
-    def to_json(self):
-        return super().to_json()
+    __slots__ = ()
+    cmd_id = "imu_calibrate"
+    _FIELDS = ()
 
 class InterialSetCrashSensitivity(VexWebSocketCommand):
+    __slots__ = ("sensitivity",)
+    cmd_id = "imu_set_crash_threshold"
+    _FIELDS = ("sensitivity",)
+
     def __init__(self, sensitivity=0):
-        super().__init__("imu_set_crash_threshold")
         self.sensitivity = sensitivity
-
-    def to_json(self):
-        base_data = super().to_json()
-        base_data.update({
-            "sensitivity": self.sensitivity
-        })
-        return base_data
 #endregion Interial Commands
 
 #region Kicker Commands
 class KickerKick(VexWebSocketCommand):
-    def __init__(self, kick_type=""):
-        super().__init__(kick_type)
+    # the kick strength is the command id, so it stays per-instance
+    __slots__ = ("cmd_id",)
+    _FIELDS = ()
 
-    def to_json(self):
-        return super().to_json()
+    def __init__(self, kick_type=""):
+        self.cmd_id = kick_type.value if isinstance(kick_type, Enum) else kick_type
 #endregion Kicker Commands
 
 #region Sound Commands
 class SoundPlay(VexWebSocketCommand):
+    __slots__ = ("name", "volume")
+    cmd_id = "play_sound"
+    _FIELDS = ("name", "volume")
+
     def __init__(self, name="", volume=0):
-        super().__init__("play_sound")
-        self.name = name
+        self.name = name.value if isinstance(name, Enum) else name
         self.volume = volume
-
-    def to_json(self):
-        base_data = super().to_json()
-        base_data.update({
-            "name": self.name,
-            "volume": self.volume
-        })
-        return base_data
 class SoundPlayFile(VexWebSocketCommand):
+    __slots__ = ("name", "volume")
+    cmd_id = "play_file"
+    _FIELDS = ("name", "volume")
+
     def __init__(self, name="", volume=0):
-        super().__init__("play_file")
-        self.name = name
+        self.name = name.value if isinstance(name, Enum) else name
         self.volume = volume
-
-    def to_json(self):
-        base_data = super().to_json()
-        base_data.update({
-            "name": self.name,
-            "volume": self.volume
-        })
-        return base_data
 class SoundPlayNote(VexWebSocketCommand):
+    __slots__ = ("note", "octave", "duration", "volume")
+    cmd_id = "play_note"
+    _FIELDS = ("note", "octave", "duration", "volume")
+
     def __init__(self, note=0, octave=0, duration=500, volume=0):
-        super().__init__("play_note")
         self.note = note
         self.octave = octave
         self.duration = duration
         self.volume = volume
 
-    def to_json(self):
-        base_data = super().to_json()
-        base_data.update({
-            "note": self.note,
-            "octave": self.octave,
-            "duration": self.duration,
-            "volume": self.volume
-        })
-        return base_data
-
 class SoundStop(VexWebSocketCommand):
-    def __init__(self):
-        super().__init__("stop_sound")
-
-    def to_json(self):
-        return super().to_json()
+    __slots__ = ()
+    cmd_id = "stop_sound"
+    _FIELDS = ()
 
 #endregion Sound Commands
 
 #region LED Commands
-class LedSet(VexWebSocketCommand):
+@lru_cache(maxsize=64)
+def _led_set_json(led, r, g, b):
+    """cached nested payload for LedSet; LED animations cycle through a small
+    set of (led, color) combinations, so repeats skip both dict allocations.
+    Callers serialize the result immediately and must not mutate it"""
+    return {
+        "cmd_id": LedSet.cmd_id,
+        led: {
+            "r": r,
+            "g": g,
+            "b": b
+        }
+    }
+
+class LedSet(_RGBMixin, VexWebSocketCommand):
+    __slots__ = ("led",)
+    cmd_id = "light_set"
+
     def __init__(self, led="", r=0, g=0, b=0):
-        super().__init__("light_set")
-        self.led = led
+        self.led = led.value if isinstance(led, Enum) else led
         self.r = r
         self.g = g
         self.b = b
 
     def to_json(self):
-        base_data = super().to_json()
-        base_data.update({
-            self.led: {
-            "r": self.r,
-            "g": self.g,
-            "b": self.b
-            }
-        })
-        return base_data
+        return _led_set_json(self.led, self.r, self.g, self.b)
 
 #endregion LED Commands
 
 #region AiVision Commands
-class VisionColorDescription(VexWebSocketCommand):
+class VisionColorDescription(_RGBMixin, VexWebSocketCommand):
+    __slots__ = ("id", "hdsat", "hangle")
+    cmd_id = "color_description"
+    _FIELDS = ("id", ("r", "red"), ("g", "green"), ("b", "blue"), "hangle", "hdsat")
+
     def __init__(self, id, r, g, b, hangle, hdsat ):
-        super().__init__("color_description")
         self.id = id
         self.r = r
         self.g = g
@@ -578,79 +461,38 @@ class VisionColorDescription(VexWebSocketCommand):
         self.hdsat = hdsat
         self.hangle = hangle
 
-    def to_json(self):
-        base_data = super().to_json()
-        base_data.update({
-            "id": self.id,
-            "red": self.r,
-            "green": self.g,
-            "blue": self.b,
-            "hangle": self.hangle,
-            "hdsat": self.hdsat
-        })
-        return base_data
-
 class VisionCodeDescription(VexWebSocketCommand):
+    __slots__ = ("id", "c1", "c2", "c3", "c4", "c5")
+    cmd_id = "code_description"
+    _FIELDS = ("id", "c1", "c2", "c3", "c4", "c5")
+
     def __init__(self, id, c1, c2, *args):
-        super().__init__("code_description")
         self.id = id
         self.c1 = c1.id
         self.c2 = c2.id
-        self.c3 = -1
-        self.c4 = -1
-        self.c5 = -1
-        if( len(args) > 0 ):
-            self.c3 = args[0].id
-        if( len(args) > 1 ):
-            self.c3 = args[1].id
-        if( len(args) > 2 ):
-            self.c3 = args[2].id
-
-    def to_json(self):
-        base_data = super().to_json()
-        base_data.update({
-            "id": self.id,
-            "c1": self.c1,
-            "c2": self.c2,
-            "c3": self.c3,
-            "c4": self.c4,
-            "c5": self.c5
-        })
-        return base_data
+        ids = [arg.id for arg in args[:3]] + [-1, -1, -1]
+        self.c3, self.c4, self.c5 = ids[0], ids[1], ids[2]
 class VisionTagDetection(VexWebSocketCommand):
+    __slots__ = ("b_enable",)
+    cmd_id = "tag_detection"
+    _FIELDS = ("b_enable",)
+
     def __init__(self, enable=True):
-        super().__init__("tag_detection")
         self.b_enable = enable
 
-    def to_json(self):
-        base_data = super().to_json()
-        base_data.update({
-            "b_enable": self.b_enable
-        })
-        return base_data
-
 class VisionColorDetection(VexWebSocketCommand):
+    __slots__ = ("b_enable", "b_merge")
+    cmd_id = "color_detection"
+    _FIELDS = ("b_enable", "b_merge")
+
     def __init__(self, enable=True, merge=True):
-        super().__init__("color_detection")
         self.b_enable = enable
         self.b_merge = merge
-
-    def to_json(self):
-        base_data = super().to_json()
-        base_data.update({
-            "b_enable": self.b_enable,
-            "b_merge": self.b_merge
-        })
-        return base_data
 class VisionModelDetection(VexWebSocketCommand):
+    __slots__ = ("b_enable",)
+    cmd_id = "model_detection"
+    _FIELDS = ("b_enable",)
+
     def __init__(self, enable=True):
-        super().__init__("model_detection")
         self.b_enable = enable
-
-    def to_json(self):
-        base_data = super().to_json()
-        base_data.update({
-            "b_enable": self.b_enable
-        })
-        return base_data
 #endregion AiVision Commands
@@ -8,8 +8,29 @@ AIM WebSocket API - Types
 This module defines various types and enums used in the AIM WebSocket API.
 """
 from enum import Enum
+from functools import lru_cache
 from typing import Union
-import re
+
+
+_HEX = frozenset("0123456789abcdefABCDEF")
+
+@lru_cache(maxsize=256)
+def _parse_web_color(color: str) -> int:
+    '''parse a '#FFF' or '#FFFFFF' webcolor into its integer value, 0 if invalid.
+    Cached because user programs typically reuse a handful of color literals.'''
+    if not color.startswith('#') or len(color) not in (4, 7):
+        return 0
+    digits = color[1:]
+    # validate explicitly: int(s, 16) alone would also accept signs,
+    # underscores and surrounding whitespace
+    if not all(c in _HEX for c in digits):
+        return 0
+    value = int(digits, 16)
+    if len(color) == 7:
+        return value
+    # expand each nibble into a full byte: #RGB -> #RRGGBB
+    r, g, b = (value >> 8) & 0xF, (value >> 4) & 0xF, value & 0xF
+    return (r << 20) | (r << 16) | (g << 12) | (g << 8) | (b << 4) | b
 
 class SoundType(str, Enum):
     '''The defined sounds for AIM.'''
@@ -204,15 +225,25 @@ class Color:
     '''
     class DefinedColor:
         '''### DefinedColor class - create a new DefinedColor'''
+        __slots__ = ("value", "transparent", "rgb", "r", "g", "b", "_str")
+
         def __init__(self, value, transparent=False):
             self.value = value
             self.transparent = transparent
+            self.rgb = ((value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF)
+            self.r, self.g, self.b = self.rgb
+            # palette colors are immutable, so format the string form once
+            self._str = f'{value:#08x}'
+
+        def channels(self):
+            '''return the cached (r, g, b) byte channels'''
+            return self.rgb
 
         def __str__(self):
-            return Color._format_color_as_str(self.value)
+            return self._str
 
         def __repr__(self):
-            return Color._format_color_as_str(self.value)
+            return self._str
 
     BLACK       = DefinedColor(0x000000)
     '''predefined Color black'''
@@ -245,16 +276,50 @@ class Color:
             self.value = ((args[0] & 0xFF) << 16) + ((args[1] & 0xFF) << 8) + (args[2] & 0xFF)
         else:
             raise TypeError("bad parameters")
+        # precomputed (r, g, b) channels so hot paths don't shift/mask on every use
+        self.rgb = ((self.value >> 16) & 0xFF, (self.value >> 8) & 0xFF, self.value & 0xFF)
+        self.r, self.g, self.b = self.rgb
+        self._str = f'{self.value:#08x}'
 
     def __str__(self):
-        return Color._format_color_as_str(self.value)
+        return self._str
 
     def __repr__(self):
-        return Color._format_color_as_str(self.value)
+        return self._str
+
+    def channels(self):
+        '''return the cached (r, g, b) byte channels'''
+        return self.rgb
+
+    @staticmethod
+    def of(value: int) -> 'Color':
+        '''### return a shared Color instance for the given hex value
+
+        Colors returned here are cached flyweights: per-frame drawing code
+        can call `Color.of(0xFF0000)` without allocating a new instance each
+        time. Do not call set_rgb on a shared instance; construct a Color
+        directly when mutation is needed.
+
+        #### Arguments:
+            value: The color value as a hex integer, e.g. 0xFF0000
+
+        #### Returns:
+            A shared instance of the Color class
+        '''
+        return _color_of(value)
+
+    # formatted-string cache for _format_color_as_str; real programs format
+    # the same handful of palette values over and over
+    _STR_CACHE = {}
 
     @staticmethod
     def _format_color_as_str(value):
-        return f'{value:#08x}'
+        s = Color._STR_CACHE.get(value)
+        if s is None:
+            if len(Color._STR_CACHE) > 1024:
+                Color._STR_CACHE.clear()
+            s = Color._STR_CACHE[value] = f'{value:#08x}'
+        return s
 
     def _color_from_str(self, color:str) -> int:
         '''### convert string to color value
@@ -265,13 +330,7 @@ class Color:
         #### Returns:
             integer value representing the color
         '''
-        value = 0
-        if re.match("#[a-fA-F0-9]{3}$", color):
-            r,g,b = int(color[1], 16), int(color[2], 16), int(color[3], 16)
-            value = (r << 20) + (r << 16) + (g  << 12) + (g  << 8) + (b << 4) + b
-        elif re.match("#[a-fA-F0-9]{6}$", color):
-            value = int(color[1:], 16)             
-        return value
+        return _parse_web_color(color)
 
     def set_rgb(self, *args):
         '''### change existing Color instance to new rgb value
@@ -296,6 +355,15 @@ class Color:
             self.value = args[0]
         if len(args) == 3 and all(isinstance(arg, int) for arg in args):
             self.value = ((args[0] & 0xFF) << 16) + ((args[1] & 0xFF) << 8) + (args[2] & 0xFF)
+        self.rgb = ((self.value >> 16) & 0xFF, (self.value >> 8) & 0xFF, self.value & 0xFF)
+        self.r, self.g, self.b = self.rgb
+        self._str = f'{self.value:#08x}'
+
+# backs Color.of; caching the constructor itself would hand out shared
+# instances to callers that may legitimately set_rgb them
+@lru_cache(maxsize=256)
+def _color_of(value: int) -> Color:
+    return Color(value)
 
 class EmojiType(Enum):
     '''The defined emoji for AIM.'''
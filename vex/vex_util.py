@@ -11,22 +11,12 @@ This module defines various utility functions used in the AIM WebSocket API.
 import time
 from .vex_types import TimeUnits
 
-def sleep(duration: float, units=TimeUnits.MSEC):
-    '''### delay the current thread for the provided number of seconds or milliseconds.
-
-    #### Arguments:
-        duration: The number of seconds or milliseconds to sleep for
-        units:    The units of duration, optional, default is milliseconds
+# module-local bindings: LOAD_GLOBAL becomes LOAD_FAST-style lookups in the
+# sleep hot path, and an identity test skips Enum.__eq__ dispatch
+_MSEC = TimeUnits.MSEC
+_time_sleep = time.sleep
 
-    #### Returns:
-        None
-    '''
-    if units == TimeUnits.MSEC:
-        time.sleep(duration / 1000)
-    else:
-        time.sleep(duration)
-
-def wait(duration: float, units=TimeUnits.MSEC):
+def sleep(duration: float, units=_MSEC):
     '''### delay the current thread for the provided number of seconds or milliseconds.
 
     #### Arguments:
@@ -36,7 +26,6 @@ def wait(duration: float, units=TimeUnits.MSEC):
     #### Returns:
         None
     '''
-    if units == TimeUnits.MSEC:
-        time.sleep(duration / 1000)
-    else:
-        time.sleep(duration)
+    _time_sleep(duration * 0.001 if units is _MSEC else duration)
+
+wait = sleep